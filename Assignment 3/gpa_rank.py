@@ -0,0 +1,124 @@
+"""
+CIS 216 – Assignment 3 (Properties), GPA rank and percentile
+Author: Amtoj Singh
+
+Honors and probation decisions need a student's class rank and GPA
+percentile. Sorting the roster for every question is O(n log n).
+
+The gpa setter rounds to 0.01, so a GPA can only be one of 401 values
+(0.00 .. 4.00). GpaRankIndex counts students per value in a Fenwick
+(binary indexed) tree over those 401 slots, so "how many students have
+a GPA <= x" is a prefix sum, and both that and moving one student are
+O(log 401): about 9 steps, however big the roster.
+
+  rank(s)          1 + number of students with a higher GPA (ties share a rank)
+  percentile(s)    % of students below, counting ties as half (0..100)
+  count_above(x)   students with GPA strictly above x
+
+Like StudentIndex, it puts a watcher in each student's _watchers, so
+setting gpa moves the student in the tree right away.
+"""
+
+import math
+
+SLOTS = 401    # 0.00, 0.01, ... 4.00
+
+
+def _slot(gpa):
+    return round(gpa * 100)
+
+
+def _slots_at_or_below(x):
+    """Number of GPA slots whose value k / 100 is <= x."""
+    k = math.floor(x * 100)
+    # x * 100 can land a hair off an exact hundredth
+    if (k + 1) / 100 <= x:
+        k += 1
+    elif k / 100 > x:
+        k -= 1
+    return min(max(k + 1, 0), SLOTS)
+
+
+class GpaRankIndex:
+    def __init__(self, students=()):
+        self._tree = [0] * (SLOTS + 1)   # 1-based Fenwick tree
+        self._slots = {}                 # id(Student) -> slot it is counted in
+        self._students = {}              # id(Student) -> Student, so the id stays taken
+        self._count = 0
+        for s in students:
+            self.add(s)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, student):
+        return id(student) in self._slots
+
+    # --- Fenwick tree ---
+    def _update(self, slot, delta):
+        i = slot + 1
+        tree = self._tree
+        while i <= SLOTS:
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, n):
+        """Students in the lowest n slots."""
+        total = 0
+        tree = self._tree
+        while n > 0:
+            total += tree[n]
+            n -= n & -n
+        return total
+
+    # --- maintenance ---
+    def add(self, student):
+        if student in self:
+            return
+        slot = _slot(student.gpa)
+        self._slots[id(student)] = slot
+        self._students[id(student)] = student
+        self._update(slot, 1)
+        self._count += 1
+        student._watchers = student._watchers + (self._on_change,)
+
+    def remove(self, student):
+        self._update(self._slots.pop(id(student)), -1)
+        del self._students[id(student)]
+        self._count -= 1
+        student._watchers = tuple(w for w in student._watchers if w != self._on_change)
+
+    def _on_change(self, student, field):
+        if field != "gpa":
+            return
+        old = self._slots.get(id(student))
+        new = _slot(student.gpa)
+        if old is not None and old != new:
+            self._update(old, -1)
+            self._update(new, 1)
+            self._slots[id(student)] = new
+
+    # --- queries ---
+    def count_at_or_below(self, gpa):
+        return self._prefix(_slots_at_or_below(gpa))
+
+    def count_above(self, gpa):
+        return self._count - self.count_at_or_below(gpa)
+
+    def count_below(self, gpa):
+        slots = _slots_at_or_below(gpa)
+        if slots and (slots - 1) / 100 == gpa:
+            slots -= 1    # leave out the students exactly at gpa
+        return self._prefix(slots)
+
+    def rank(self, student_or_gpa):
+        gpa = getattr(student_or_gpa, "gpa", student_or_gpa)
+        return self.count_above(gpa) + 1
+
+    def percentile(self, student_or_gpa):
+        if not self._count:
+            return 0.0
+        gpa = getattr(student_or_gpa, "gpa", student_or_gpa)
+        below = self.count_below(gpa)
+        ties = self.count_at_or_below(gpa) - below
+        return 100.0 * (below + ties / 2) / self._count
@@ -5,12 +5,128 @@ Author: Amtoj Singh
 One-file example that uses Python properties to:
 - keep fields clean (basic checks in setters),
 - expose a read-only id,
-- and compute a few values from existing data.
+- and compute a few values from existing data (bmi is cached until
+  weight or height changes).
 
 Reference used (non-Wikiversity, for property syntax only):
 https://docs.python.org/3/library/functions.html#property
 """
 
+# --- field rules (used by the setters below and by student_bulk) ---
+def clean_name(value):
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("Name cannot be empty")
+    return value.strip().title()
+
+
+def clean_email(value):
+    if not isinstance(value, str) or "@" not in value or "." not in value.split("@")[-1]:
+        raise ValueError("Email must look like user@example.com")
+    return value.strip()
+
+
+def clean_age(value):
+    if not isinstance(value, int) or not (0 <= value <= 110):
+        raise ValueError("Age must be an integer between 0 and 110")
+    return value
+
+
+def clean_gpa(value):
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("GPA must be a number")
+    if not (0.0 <= f <= 4.0):
+        raise ValueError("GPA must be between 0.0 and 4.0")
+    return round(f, 2)
+
+
+def clean_credits(value):
+    if not isinstance(value, int) or value < 0:
+        raise ValueError("Credits must be a non-negative integer")
+    return value
+
+
+def clean_weight_kg(value):
+    if value is None:
+        return None
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("weight_kg must be a number")
+    if f <= 0 or f > 400:
+        raise ValueError("weight_kg must be > 0 and realistic")
+    return round(f, 2)
+
+
+def clean_height_m(value):
+    if value is None:
+        return None
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("height_m must be a number")
+    if f <= 0 or not (0.5 <= f <= 2.7):
+        raise ValueError("height_m must be realistic (0.5..2.7 meters)")
+    return round(f, 3)
+
+
+_MISSING = object()
+
+
+class computed_property:
+    """
+    Read-only computed value that is cached on the instance and recomputed
+    only after one of the fields it depends on is set.
+
+        @computed_property("credits")
+        def standing(self): ...
+
+    The first read stores the result in the instance __dict__ under
+    "_cached_<name>", and later reads return it from there. Assigning to
+    or deleting the property raises AttributeError, as it would for a
+    property without a setter. Setters call self._field_changed(field),
+    which drops just the cached values that depend on that field.
+
+    A cached read still runs __get__ (about as costly as a plain
+    property), so this only pays for values that are slow to work out:
+    bmi, yes (~5x faster cached); standing and full_time_status, no.
+    """
+
+    def __init__(self, *depends_on):
+        self.depends_on = depends_on
+        self.func = None
+
+    def __call__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.key = "_cached_" + name
+        if "_dependents" not in owner.__dict__:
+            # copy, so subclasses never add to their parent's map
+            owner._dependents = {k: list(v) for k, v in getattr(owner, "_dependents", {}).items()}
+        for field in self.depends_on:
+            owner._dependents.setdefault(field, []).append(self.key)
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        d = obj.__dict__
+        value = d.get(self.key, _MISSING)
+        if value is _MISSING:
+            value = d[self.key] = self.func(obj)
+        return value
+
+    def __set__(self, obj, value):
+        raise AttributeError(f"{self.name} is computed and cannot be set")
+
+    def __delete__(self, obj):
+        raise AttributeError(f"{self.name} is computed and cannot be deleted")
+
+
 class Student:
     def __init__(self, student_id, name, email, age, gpa, credits, weight_kg=None, height_m=None):
         # read-only id (no setter provided later)
@@ -39,9 +155,8 @@ class Student:
 
     @name.setter
     def name(self, value):
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError("Name cannot be empty")
-        self._name = value.strip().title()
+        self._name = clean_name(value)
+        self._field_changed("name")
 
     # --- email (simple check only) ---
     @property
@@ -50,9 +165,8 @@ class Student:
 
     @email.setter
     def email(self, value):
-        if not isinstance(value, str) or "@" not in value or "." not in value.split("@")[-1]:
-            raise ValueError("Email must look like user@example.com")
-        self._email = value.strip()
+        self._email = clean_email(value)
+        self._field_changed("email")
 
     # --- age ---
     @property
@@ -61,9 +175,8 @@ class Student:
 
     @age.setter
     def age(self, value):
-        if not isinstance(value, int) or not (0 <= value <= 110):
-            raise ValueError("Age must be an integer between 0 and 110")
-        self._age = value
+        self._age = clean_age(value)
+        self._field_changed("age")
 
     # --- gpa ---
     @property
@@ -72,13 +185,8 @@ class Student:
 
     @gpa.setter
     def gpa(self, value):
-        try:
-            f = float(value)
-        except (TypeError, ValueError):
-            raise ValueError("GPA must be a number")
-        if not (0.0 <= f <= 4.0):
-            raise ValueError("GPA must be between 0.0 and 4.0")
-        self._gpa = round(f, 2)
+        self._gpa = clean_gpa(value)
+        self._field_changed("gpa")
 
     # --- credits ---
     @property
@@ -87,9 +195,8 @@ class Student:
 
     @credits.setter
     def credits(self, value):
-        if not isinstance(value, int) or value < 0:
-            raise ValueError("Credits must be a non-negative integer")
-        self._credits = value
+        self._credits = clean_credits(value)
+        self._field_changed("credits")
 
     # --- optional: weight_kg ---
     @property
@@ -98,16 +205,8 @@ class Student:
 
     @weight_kg.setter
     def weight_kg(self, value):
-        if value is None:
-            self._weight_kg = None
-            return
-        try:
-            f = float(value)
-        except (TypeError, ValueError):
-            raise ValueError("weight_kg must be a number")
-        if f <= 0 or f > 400:
-            raise ValueError("weight_kg must be > 0 and realistic")
-        self._weight_kg = round(f, 2)
+        self._weight_kg = clean_weight_kg(value)
+        self._field_changed("weight_kg")
 
     # --- optional: height_m ---
     @property
@@ -116,16 +215,30 @@ class Student:
 
     @height_m.setter
     def height_m(self, value):
-        if value is None:
-            self._height_m = None
-            return
-        try:
-            f = float(value)
-        except (TypeError, ValueError):
-            raise ValueError("height_m must be a number")
-        if f <= 0 or not (0.5 <= f <= 2.7):
-            raise ValueError("height_m must be realistic (0.5..2.7 meters)")
-        self._height_m = round(f, 3)
+        self._height_m = clean_height_m(value)
+        self._field_changed("height_m")
+
+    @classmethod
+    def _from_clean(cls, student_id, name, email, age, gpa, credits, weight_kg, height_m):
+        """Build from values that already passed the clean_* rules (no re-checks)."""
+        obj = cls.__new__(cls)
+        # same attributes, in the same order, as __init__ leaves behind
+        obj.__dict__ = {"_student_id": student_id, "_name": name, "_email": email, "_age": age,
+                        "_gpa": gpa, "_credits": credits, "_weight_kg": weight_kg,
+                        "_height_m": height_m}
+        return obj
+
+    # --- cached computed values ---
+    # callbacks(student, field) run after any setter; indexes add theirs here
+    _watchers = ()
+
+    def _field_changed(self, field):
+        """Called by every setter; forgets the cached values built from field."""
+        d = self.__dict__
+        for key in self._dependents.get(field, ()):
+            d.pop(key, None)
+        for watcher in self._watchers:
+            watcher(self, field)
 
     # --- computed properties ---
     @property
@@ -143,7 +256,7 @@ class Student:
             return "Junior"
         return "Senior"
 
-    @property
+    @computed_property("weight_kg", "height_m")
     def bmi(self):
         if self.weight_kg is None or self.height_m is None:
             return None
@@ -156,8 +269,9 @@ class Student:
             f"GPA: {self.gpa}",
             f"Credits: {self.credits} — {self.full_time_status}, {self.standing}",
         ]
-        if self.bmi is not None:
-            parts.append(f"BMI: {self.bmi}")
+        bmi = self.bmi
+        if bmi is not None:
+            parts.append(f"BMI: {bmi}")
         else:
             parts.append("BMI: N/A")
         return " | ".join(parts)
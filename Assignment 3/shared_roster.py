@@ -0,0 +1,182 @@
+"""
+CIS 216 – Assignment 3 (Properties), roster shared between threads
+Author: Amtoj Singh
+
+In a multi-threaded web service one thread can be half-way through
+setting credits while another reads standing. SharedRoster avoids that
+with copy-on-write snapshots instead of a lock on the read path:
+
+  - the roster is a dict student_id -> FrozenStudent, and that dict is
+    never changed once it has been published
+  - readers just read the current dict reference (one attribute load),
+    so any number of reader threads run without ever waiting on each
+    other or on writers
+  - writers (one at a time, behind a lock) copy the student they are
+    changing, run the normal Student setters on the copy, freeze it,
+    copy the dict with the new student in it and publish it with a
+    single assignment
+
+So update(sid, credits=95, gpa=3.2) is atomic: readers see either the
+old student or the new one, never a mix. update_many() does the same
+for several students at once. If any setter rejects a value, nothing
+is published.
+
+Writes cost a dict copy (O(n)), which suits a read-heavy service.
+Batch writes with update_many().
+
+Benchmark:
+    python shared_roster.py
+"""
+
+from collections import Counter
+import threading
+import time
+from types import MappingProxyType
+
+from properties_demo import Student
+
+# fields with a validating setter; everything else (student_id, computed
+# values, the private _fields behind the setters) is refused
+SETTABLE = ("name", "email", "age", "gpa", "credits", "weight_kg", "height_m")
+
+
+class FrozenStudent(Student):
+    """A Student whose setters are switched off (computed values still cache)."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError("students in a SharedRoster are read-only; use roster.update()")
+
+    def __delattr__(self, name):
+        raise AttributeError("students in a SharedRoster are read-only; use roster.update()")
+
+
+def _thaw(student):
+    """A private, mutable copy with the same fields (no cached values, no watchers)."""
+    return Student._from_clean(student.student_id, student.name, student.email, student.age,
+                               student.gpa, student.credits, student.weight_kg,
+                               student.height_m)
+
+
+def _freeze(student):
+    object.__setattr__(student, "__class__", FrozenStudent)
+    return student
+
+
+class SharedRoster:
+    def __init__(self, students=()):
+        self._write_lock = threading.Lock()
+        self._students = {s.student_id: _freeze(_thaw(s)) for s in students}
+        self.version = 0
+
+    # --- readers: never lock ---
+    def get(self, student_id):
+        return self._students[student_id]
+
+    def __contains__(self, student_id):
+        return student_id in self._students
+
+    def __len__(self):
+        return len(self._students)
+
+    def snapshot(self):
+        """Read-only view of the whole roster as of now (later writes don't show up)."""
+        return MappingProxyType(self._students)
+
+    def __iter__(self):
+        return iter(list(self._students.values()))
+
+    # --- writers: one at a time ---
+    def _publish(self, changed, removed=()):
+        students = dict(self._students)
+        for sid in removed:
+            del students[sid]
+        students.update(changed)
+        self._students = students   # the atomic swap
+        self.version += 1
+
+    def add(self, student):
+        with self._write_lock:
+            if student.student_id in self._students:
+                raise KeyError(f"student {student.student_id!r} is already in the roster")
+            frozen = _freeze(_thaw(student))
+            self._publish({student.student_id: frozen})
+            return frozen
+
+    def remove(self, student_id):
+        with self._write_lock:
+            if student_id not in self._students:
+                raise KeyError(student_id)
+            self._publish({}, removed=(student_id,))
+
+    def update(self, student_id, **fields):
+        """Set several fields of one student atomically; returns the new student."""
+        return self.update_many({student_id: fields})[student_id]
+
+    def update_many(self, changes):
+        """changes: {student_id: {field: value}}. All of it is published, or none."""
+        with self._write_lock:
+            current = self._students
+            changed = {}
+            for sid, fields in changes.items():
+                student = _thaw(current[sid])
+                for field, value in fields.items():
+                    if field not in SETTABLE:
+                        raise AttributeError(f"cannot set {field!r}")
+                    setattr(student, field, value)    # the normal setter checks
+                changed[sid] = _freeze(student)
+            self._publish(changed)
+            return changed
+
+
+def benchmark_readers(roster, thread_counts=(1, 4, 16), seconds=1.0):
+    """
+    Readers look up random students and read standing / full_time_status /
+    bmi while one writer keeps updating credits. Returns
+    {threads: total reads per second}.
+    """
+    ids = list(roster.snapshot())
+    results = {}
+    for n_threads in thread_counts:
+        stop = threading.Event()
+        counts = Counter()
+
+        def reader(slot):
+            reads = 0
+            i = slot
+            get = roster.get
+            while not stop.is_set():
+                for _ in range(1000):
+                    s = get(ids[i % len(ids)])
+                    s.standing, s.full_time_status, s.bmi
+                    i += 7
+                reads += 1000
+            counts[slot] = reads
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                sid = ids[i % len(ids)]
+                roster.update(sid, credits=(roster.get(sid).credits + 1) % 130)
+                i += 1
+                time.sleep(0.001)
+
+        threads = [threading.Thread(target=reader, args=(k,)) for k in range(n_threads)]
+        threads.append(threading.Thread(target=writer))
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        results[n_threads] = sum(counts.values()) / (time.perf_counter() - started)
+    return results
+
+
+if __name__ == "__main__":
+    students = [Student(i, f"student {i}", f"s{i}@mail.harpercollege.edu", 18 + i % 40,
+                        (i * 7 % 401) / 100, i % 130, 60 + i % 40, 1.6 + (i % 30) / 100)
+                for i in range(10000)]
+    roster = SharedRoster(students)
+    for threads, rate in benchmark_readers(roster).items():
+        print(f"{threads:>2} reader thread(s): {rate:,.0f} reads/s")
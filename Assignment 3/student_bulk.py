@@ -0,0 +1,125 @@
+"""
+CIS 216 – Assignment 3 (Properties), bulk construction
+Author: Amtoj Singh
+
+Student(...) runs eight setters per object (each with its own checks,
+float() and round() calls, plus the cache/index hook). For 300k
+students coming from a clean source that adds up to seconds.
+build_students() takes the data as columns instead:
+
+  - untrusted columns are checked one whole column at a time with the
+    same clean_* rules the setters use. A column that is fully valid
+    costs one list comprehension. If anything in it fails, that column
+    is re-checked value by value to collect every (row, field, message).
+  - trusted columns skip the checks entirely, but only when they come
+    with the checksum that students_to_columns() produced for them, so
+    data that was edited after export is rejected.
+
+Either way the objects are made with Student._from_clean, without going
+through the setters, and have exactly the __dict__ __init__ would give
+them.
+"""
+
+from collections import namedtuple
+from hashlib import blake2b
+
+from properties_demo import (
+    Student,
+    clean_age,
+    clean_credits,
+    clean_email,
+    clean_gpa,
+    clean_height_m,
+    clean_name,
+    clean_weight_kg,
+)
+from student_store import FIELDS
+
+RowError = namedtuple("RowError", "row field message")   # row is 1-based
+
+_RULES = (
+    ("student_id", None),      # read-only id: __init__ takes it as is
+    ("name", clean_name),
+    ("email", clean_email),
+    ("age", clean_age),
+    ("gpa", clean_gpa),
+    ("credits", clean_credits),
+    ("weight_kg", clean_weight_kg),
+    ("height_m", clean_height_m),
+)
+_OPTIONAL = ("weight_kg", "height_m")
+
+
+def columns_checksum(columns):
+    """blake2b over every column, in FIELDS order."""
+    h = blake2b(digest_size=16)
+    for field in FIELDS:
+        h.update(repr(columns[field]).encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def students_to_columns(students):
+    """(columns, checksum) for a list of Students; feed both back as trusted."""
+    columns = {field: [getattr(s, field) for s in students] for field in FIELDS}
+    return columns, columns_checksum(columns)
+
+
+def _full_columns(columns):
+    n = len(columns["student_id"])
+    out = {}
+    for field in FIELDS:
+        if field in columns:
+            out[field] = columns[field]
+        elif field in _OPTIONAL:
+            out[field] = [None] * n
+        else:
+            raise ValueError(f"missing column: {field}")
+        if len(out[field]) != n:
+            raise ValueError(f"column {field} has {len(out[field])} rows, expected {n}")
+    return out
+
+
+def validate_columns(columns):
+    """-> (clean columns without the bad rows, list of RowError in row order)"""
+    columns = _full_columns(columns)
+    clean = {}
+    errors = []
+    for field, rule in _RULES:
+        values = columns[field]
+        if rule is None:
+            clean[field] = list(values)
+            continue
+        try:
+            clean[field] = [rule(v) for v in values]
+        except ValueError:
+            out = []
+            for row, v in enumerate(values, start=1):
+                try:
+                    out.append(rule(v))
+                except ValueError as e:
+                    errors.append(RowError(row, field, str(e)))
+                    out.append(None)
+            clean[field] = out
+    if errors:
+        errors.sort(key=lambda e: e.row)   # stable: fields stay in setter order
+        bad = {e.row - 1 for e in errors}
+        clean = {field: [v for i, v in enumerate(values) if i not in bad]
+                 for field, values in clean.items()}
+    return clean, errors
+
+
+def build_students(columns, trusted=False, checksum=None):
+    """
+    columns: {"student_id": [...], "name": [...], ...}; weight_kg and
+    height_m may be left out. Returns (students, errors).
+    """
+    if trusted:
+        columns = _full_columns(columns)
+        if checksum is None or checksum != columns_checksum(columns):
+            raise ValueError("trusted columns need the checksum they were exported with")
+        errors = []
+    else:
+        columns, errors = validate_columns(columns)
+    students = list(map(Student._from_clean, *(columns[field] for field in FIELDS)))
+    return students, errors
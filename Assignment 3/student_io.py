@@ -0,0 +1,209 @@
+"""
+CIS 216 – Assignment 3 (Properties), saving and loading rosters
+Author: Amtoj Singh
+
+Two file formats, both streamed so a million-student roster never has
+to be in memory at once:
+
+  JSON Lines   one {"student_id": ..., "name": ..., ...} object per line
+  binary       "STU1" header, then one record per student:
+                   <qBIHdd  student_id, age, credits, gpa * 100,
+                            weight_kg, height_m (NaN = not given)
+                   <HH      byte lengths of name and email
+                   name and email as UTF-8
+               plus a sidecar index (path + ".idx"): "STX1" then one
+               little-endian uint64 file offset per record, so
+               BinaryRoster(path)[i] seeks straight to record i.
+
+Writers collect records into a ~1 MB buffer and write it in one call.
+Readers are generators and yield one Student at a time. gpa is stored
+in hundredths, which is exact because the setter already rounds it to
+0.01.
+
+Readers rebuild students with Student(...) so every value goes through
+the setters again. Pass trusted=True for files this module wrote and
+nobody edited since: the objects are then built with
+Student._from_clean and the setters are skipped.
+"""
+
+from array import array
+import json
+import math
+import struct
+import sys
+
+from properties_demo import Student
+from student_store import FIELDS
+
+_MAGIC = b"STU1"
+_INDEX_MAGIC = b"STX1"
+_FIXED = struct.Struct("<qBIHddHH")
+_OFFSET = struct.Struct("<Q")
+_FLUSH_AT = 1 << 20
+_NAN = float("nan")
+
+
+def _make(values, trusted):
+    return Student._from_clean(*values) if trusted else Student(*values)
+
+
+# --- JSON Lines ---
+def write_jsonl(students, path):
+    """Write students as JSON Lines; returns how many were written."""
+    count = 0
+    chunk = []
+    size = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for s in students:
+            line = json.dumps({field: getattr(s, field) for field in FIELDS}) + "\n"
+            chunk.append(line)
+            size += len(line)
+            count += 1
+            if size >= _FLUSH_AT:
+                f.write("".join(chunk))
+                chunk.clear()
+                size = 0
+        f.write("".join(chunk))
+    return count
+
+
+def read_jsonl(path, trusted=False):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                rec = json.loads(line)
+                yield _make([rec.get(field) for field in FIELDS], trusted)
+
+
+# --- binary ---
+def _pack(s):
+    name = s.name.encode("utf-8")
+    email = s.email.encode("utf-8")
+    sid = s.student_id
+    if not isinstance(sid, int):
+        raise ValueError("binary rosters need integer student ids")
+    weight = s.weight_kg
+    height = s.height_m
+    return _FIXED.pack(sid, s.age, s.credits, round(s.gpa * 100),
+                       _NAN if weight is None else weight,
+                       _NAN if height is None else height,
+                       len(name), len(email)) + name + email
+
+
+def _unpack_fixed(fixed):
+    sid, age, credits, gpa, weight, height, name_len, email_len = _FIXED.unpack(fixed)
+    return ([sid, None, None, age, gpa / 100, credits,
+             None if math.isnan(weight) else weight,
+             None if math.isnan(height) else height],
+            name_len, email_len)
+
+
+def _read_record(f):
+    fixed = f.read(_FIXED.size)
+    if not fixed:
+        return None
+    if len(fixed) < _FIXED.size:
+        raise ValueError("binary roster is truncated")
+    values, name_len, email_len = _unpack_fixed(fixed)
+    text = f.read(name_len + email_len)
+    if len(text) < name_len + email_len:
+        raise ValueError("binary roster is truncated")
+    values[1] = text[:name_len].decode("utf-8")
+    values[2] = text[name_len:].decode("utf-8")
+    return values
+
+
+def _little_endian(offsets):
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def write_binary(students, path):
+    """Write the records to path and the offset index to path + ".idx"."""
+    count = 0
+    offset = len(_MAGIC)
+    buf = bytearray()
+    offsets = array("Q")
+    with open(path, "wb") as f, open(path + ".idx", "wb") as idx:
+        f.write(_MAGIC)
+        idx.write(_INDEX_MAGIC)
+        for s in students:
+            record = _pack(s)
+            offsets.append(offset)
+            offset += len(record)
+            buf += record
+            count += 1
+            if len(buf) >= _FLUSH_AT:
+                f.write(buf)
+                buf.clear()
+                idx.write(_little_endian(offsets))
+                offsets = array("Q")
+        f.write(buf)
+        idx.write(_little_endian(offsets))
+    return count
+
+
+def _check_magic(f, magic, path):
+    if f.read(len(magic)) != magic:
+        raise ValueError(f"{path} is not a binary student roster")
+
+
+def read_binary(path, trusted=False):
+    with open(path, "rb", buffering=_FLUSH_AT) as f:
+        _check_magic(f, _MAGIC, path)
+        while True:
+            values = _read_record(f)
+            if values is None:
+                return
+            yield _make(values, trusted)
+
+
+class BinaryRoster:
+    """Random access into a binary roster through its .idx file."""
+
+    def __init__(self, path, trusted=False):
+        self.path = path
+        self.trusted = trusted
+        self._data = open(path, "rb")
+        self._index = open(path + ".idx", "rb")
+        _check_magic(self._data, _MAGIC, path)
+        _check_magic(self._index, _INDEX_MAGIC, path + ".idx")
+        self._index.seek(0, 2)
+        self._count = (self._index.tell() - len(_INDEX_MAGIC)) // _OFFSET.size
+
+    def __len__(self):
+        return self._count
+
+    def offset(self, i):
+        if not -self._count <= i < self._count:
+            raise IndexError("student record out of range")
+        self._index.seek(len(_INDEX_MAGIC) + (i % self._count) * _OFFSET.size)
+        return _OFFSET.unpack(self._index.read(_OFFSET.size))[0]
+
+    def __getitem__(self, i):
+        self._data.seek(self.offset(i))
+        return _make(_read_record(self._data), self.trusted)
+
+    def iter_from(self, i):
+        """Stream records i, i+1, ... to the end (own file handle, reads sequentially)."""
+        if i >= self._count:
+            return
+        start = self.offset(i)
+        with open(self.path, "rb", buffering=_FLUSH_AT) as f:
+            f.seek(start)
+            while True:
+                values = _read_record(f)
+                if values is None:
+                    return
+                yield _make(values, self.trusted)
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
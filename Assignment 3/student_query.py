@@ -0,0 +1,163 @@
+"""
+CIS 216 – Assignment 3 (Properties), indexed roster queries
+Author: Amtoj Singh
+
+Advising tools filter students by GPA range, credit band, standing and
+full-time status. Scanning the roster and reading properties for every
+student is O(n) per filter. StudentIndex keeps:
+
+  sorted indexes   gpa, credits: sorted lists of (value, uid), so a
+                   range is two bisects: O(log n) to find, plus the
+                   size of the answer
+  hash indexes     standing, full_time_status: value -> set of uids
+
+query() turns each predicate into a set of uids and intersects them,
+smallest set first, so the cost follows the most selective filter.
+
+Every indexed Student gets a watcher in its _watchers. The setters call
+_field_changed(), which calls the watcher, and the watcher moves the
+student inside the indexes. Changing credits also re-files standing and
+full_time_status.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+_INF = float("inf")
+
+SORTED_FIELDS = ("gpa", "credits")
+HASHED_FIELDS = ("standing", "full_time_status")
+# which indexes to refresh when a setter changes a field
+_AFFECTED = {
+    "gpa": ("gpa",),
+    "credits": ("credits", "standing", "full_time_status"),
+}
+
+
+class StudentIndex:
+    def __init__(self, students=()):
+        self._students = {}     # uid -> Student
+        self._uids = {}         # id(Student) -> uid
+        self._keys = {}         # uid -> {field: value it is filed under}
+        self._next_uid = 0
+        self._sorted = {field: [] for field in SORTED_FIELDS}
+        self._hashed = {field: {} for field in HASHED_FIELDS}
+        self.add_many(students)
+
+    def __len__(self):
+        return len(self._students)
+
+    def __iter__(self):
+        return iter(self._students.values())
+
+    def __contains__(self, student):
+        return id(student) in self._uids
+
+    # --- maintenance ---
+    def _register(self, student):
+        uid = self._next_uid
+        self._next_uid += 1
+        self._students[uid] = student
+        self._uids[id(student)] = uid
+        self._keys[uid] = {}
+        for field in HASHED_FIELDS:
+            self._file(uid, student, field)
+        student._watchers = student._watchers + (self._on_change,)
+        return uid
+
+    def add(self, student):
+        if student not in self:
+            uid = self._register(student)
+            for field in SORTED_FIELDS:
+                self._file(uid, student, field)
+
+    def add_many(self, students):
+        """add() for a batch: sorted indexes are appended to and sorted once."""
+        for student in students:
+            if student not in self:
+                uid = self._register(student)
+                keys = self._keys[uid]
+                for field, entries in self._sorted.items():
+                    value = keys[field] = getattr(student, field)
+                    entries.append((value, uid))
+        for entries in self._sorted.values():
+            entries.sort()
+
+    def remove(self, student):
+        uid = self._uids.pop(id(student))
+        for field in SORTED_FIELDS + HASHED_FIELDS:
+            self._unfile(uid, field)
+        del self._students[uid], self._keys[uid]
+        student._watchers = tuple(w for w in student._watchers if w != self._on_change)
+
+    def _file(self, uid, student, field):
+        value = getattr(student, field)
+        self._keys[uid][field] = value
+        if field in self._sorted:
+            insort(self._sorted[field], (value, uid))
+        else:
+            self._hashed[field].setdefault(value, set()).add(uid)
+
+    def _unfile(self, uid, field):
+        value = self._keys[uid][field]
+        if field in self._sorted:
+            entries = self._sorted[field]
+            del entries[bisect_left(entries, (value, uid))]
+        else:
+            bucket = self._hashed[field][value]
+            bucket.discard(uid)
+            if not bucket:
+                del self._hashed[field][value]
+
+    def _on_change(self, student, field):
+        uid = self._uids.get(id(student))
+        if uid is None:
+            return
+        for indexed in _AFFECTED.get(field, ()):
+            if getattr(student, indexed) != self._keys[uid][indexed]:
+                self._unfile(uid, indexed)
+                self._file(uid, student, indexed)
+
+    # --- lookups ---
+    def _range_uids(self, field, low=None, high=None):
+        entries = self._sorted[field]
+        start = 0 if low is None else bisect_left(entries, (low, -1))
+        stop = len(entries) if high is None else bisect_right(entries, (high, _INF))
+        return {uid for _, uid in entries[start:stop]}
+
+    def _equal_uids(self, field, value):
+        return self._hashed[field].get(value, set())
+
+    def count(self, field, value):
+        """How many students have standing / full_time_status == value."""
+        return len(self._hashed[field].get(value, ()))
+
+    def query(self, gpa=None, credits=None, standing=None, full_time=None):
+        """
+        Students matching every given filter, in the order they were added.
+          gpa, credits   (low, high), inclusive; either end may be None
+          standing       "Freshman" .. "Senior", or a set of them
+          full_time      True / False
+        """
+        sets = []
+        for field, bounds in (("gpa", gpa), ("credits", credits)):
+            if bounds is not None:
+                sets.append(self._range_uids(field, *bounds))
+        if standing is not None:
+            if isinstance(standing, str):
+                sets.append(self._equal_uids("standing", standing))
+            else:
+                sets.append(set().union(*(self._equal_uids("standing", s) for s in standing)))
+        if full_time is not None:
+            status = "Full-Time" if full_time else "Part-Time"
+            sets.append(self._equal_uids("full_time_status", status))
+
+        if not sets:
+            uids = self._students.keys()
+        else:
+            sets.sort(key=len)
+            uids = set(sets[0])
+            for other in sets[1:]:
+                if not uids:
+                    break
+                uids &= other
+        return [self._students[uid] for uid in sorted(uids)]
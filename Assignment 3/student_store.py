@@ -0,0 +1,119 @@
+"""
+CIS 216 – Assignment 3 (Properties), column store
+Author: Amtoj Singh
+
+Student works out full_time_status, standing and bmi on every property
+read, one object at a time. Registrar reports over 300k students loop
+over all of them. StudentStore keeps the same fields as columns
+(one list per field) and computes each of those values for every row
+in a single pass:
+
+  standings()    bisect over the 30/60/90 credit cut-offs
+  full_time()    credits >= 12, as bools (full_time_statuses() as text)
+  bmis()         weight / height^2 rounded to 1 place, None when unknown
+
+Results are exactly what the Student properties return.
+
+store[i] hands out a StudentView: a real Student (isinstance works,
+__str__ and the computed properties are Student's own code) whose fields
+live in the store's columns, so reading one row never copies it and the
+Student setters still validate writes to it.
+"""
+
+from bisect import bisect_right
+
+from properties_demo import Student
+
+FIELDS = ("student_id", "name", "email", "age", "gpa", "credits", "weight_kg", "height_m")
+STANDING_CUTOFFS = (30, 60, 90)
+STANDINGS = ("Freshman", "Sophomore", "Junior", "Senior")
+FULL_TIME_CREDITS = 12
+
+
+class StudentStore:
+    def __init__(self):
+        self.columns = {field: [] for field in FIELDS}
+
+    @classmethod
+    def from_students(cls, students):
+        store = cls()
+        for s in students:
+            store.append(s)
+        return store
+
+    def append(self, student):
+        """Copy an (already validated) Student in as a new row."""
+        for field, column in self.columns.items():
+            column.append(getattr(student, field))
+        return len(self) - 1
+
+    def __len__(self):
+        return len(self.columns["student_id"])
+
+    def __getitem__(self, row):
+        if not -len(self) <= row < len(self):
+            raise IndexError("student row out of range")
+        return StudentView(self, row % len(self))
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield StudentView(self, row)
+
+    # --- whole-column computed values ---
+    def standings(self):
+        cuts = STANDING_CUTOFFS
+        names = STANDINGS
+        return [names[bisect_right(cuts, c)] for c in self.columns["credits"]]
+
+    def full_time(self):
+        return [c >= FULL_TIME_CREDITS for c in self.columns["credits"]]
+
+    def full_time_statuses(self):
+        return ["Full-Time" if c >= FULL_TIME_CREDITS else "Part-Time"
+                for c in self.columns["credits"]]
+
+    def bmis(self):
+        return [None if w is None or h is None else round(w / (h ** 2), 1)
+                for w, h in zip(self.columns["weight_kg"], self.columns["height_m"])]
+
+    def standing_counts(self):
+        counts = dict.fromkeys(STANDINGS, 0)
+        for standing in self.standings():
+            counts[standing] += 1
+        return counts
+
+
+def _column_property(field):
+    def get(self):
+        return self._store.columns[field][self._row]
+
+    def set(self, value):
+        self._store.columns[field][self._row] = value
+
+    return property(get, set)
+
+
+class StudentView(Student):
+    """One store row seen as a Student (no copy; writes go to the columns)."""
+
+    def __init__(self, store, row):
+        # no Student.__init__: the row is already validated
+        self._store = store
+        self._row = row
+
+    # Student keeps its fields in _name, _email, ...; point those at the columns
+    _student_id = _column_property("student_id")
+    _name = _column_property("name")
+    _email = _column_property("email")
+    _age = _column_property("age")
+    _gpa = _column_property("gpa")
+    _credits = _column_property("credits")
+    _weight_kg = _column_property("weight_kg")
+    _height_m = _column_property("height_m")
+
+    # the columns can change under a view (another view, the store
+    # itself), so views recompute bmi instead of caching it like Student does
+    bmi = property(Student.bmi.func)
+
+    def __repr__(self):
+        return f"StudentView(row={self._row}, student_id={self.student_id!r})"
@@ -0,0 +1,305 @@
+"""
+Unit tests for Assignment 3 – Student properties
+Run:
+    python -m unittest discover -s "Assignment 3" -p "test_*.py" -v
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from gpa_rank import GpaRankIndex
+from properties_demo import Student
+from student_io import BinaryRoster, read_binary, read_jsonl, write_binary, write_jsonl
+from shared_roster import SharedRoster
+from student_bulk import build_students, students_to_columns
+from student_query import StudentIndex
+from student_store import StudentStore
+
+
+def make_students(n=200):
+    return [
+        Student(
+            student_id=1000 + i,
+            name=f"student {i}",
+            email=f"s{i}@mail.harpercollege.edu",
+            age=18 + i % 40,
+            gpa=(i * 7 % 401) / 100,
+            credits=i % 130,
+            weight_kg=None if i % 5 == 0 else 45 + i % 80,
+            height_m=None if i % 7 == 0 else 1.5 + (i % 50) / 100,
+        )
+        for i in range(n)
+    ]
+
+
+class TestStudentStore(unittest.TestCase):
+    def setUp(self):
+        self.students = make_students()
+        self.store = StudentStore.from_students(self.students)
+
+    def test_columns_match_properties(self):
+        self.assertEqual(len(self.store), len(self.students))
+        self.assertEqual(self.store.standings(), [s.standing for s in self.students])
+        self.assertEqual(self.store.full_time_statuses(),
+                         [s.full_time_status for s in self.students])
+        self.assertEqual(self.store.full_time(), [s.credits >= 12 for s in self.students])
+        self.assertEqual(self.store.bmis(), [s.bmi for s in self.students])
+        self.assertEqual(sum(self.store.standing_counts().values()), len(self.students))
+
+    def test_views_behave_like_students(self):
+        view = self.store[-1]
+        self.assertIsInstance(view, Student)
+        self.assertEqual(str(view), str(self.students[-1]))
+        view.credits = 95
+        self.assertEqual(self.store.standings()[-1], "Senior")
+        with self.assertRaises(ValueError):
+            view.gpa = 5.2
+        self.assertEqual(self.store.columns["gpa"][-1], self.students[-1].gpa)
+        with self.assertRaises(AttributeError):
+            view.student_id = 1   # still read-only
+        self.assertEqual([v.student_id for v in self.store][:2], [1000, 1001])
+
+
+class TestCachedProperties(unittest.TestCase):
+    def test_cached_until_dependency_changes(self):
+        s = make_students(3)[2]
+        bmi, weight = s.bmi, s.weight_kg
+        self.assertIn("_cached_bmi", vars(s))        # later reads come from here
+        s.credits = 60
+        self.assertIn("_cached_bmi", vars(s))        # credits do not affect bmi
+        self.assertEqual((s.standing, s.full_time_status), ("Junior", "Full-Time"))
+        s.weight_kg = 50
+        self.assertNotIn("_cached_bmi", vars(s))
+        s.weight_kg = weight
+        self.assertEqual(s.bmi, bmi)
+        s.height_m = 1.8
+        self.assertNotEqual(s.bmi, bmi)
+        s.weight_kg = None
+        self.assertIsNone(s.bmi)
+        self.assertEqual(str(s).count("BMI: N/A"), 1)
+
+    def test_computed_values_are_read_only(self):
+        s = make_students(3)[2]
+        for name in ("standing", "full_time_status", "bmi"):
+            getattr(s, name)
+            with self.assertRaises(AttributeError):
+                setattr(s, name, "Senior")
+            with self.assertRaises(AttributeError):
+                delattr(s, name)
+        self.assertEqual(s.standing, "Freshman")
+
+    def test_same_results_as_fresh_objects(self):
+        students = make_students()
+        for s in students:
+            str(s)                       # fill the caches
+            s.credits = (s.credits * 3) % 130
+            s.height_m = None if s.height_m is None else 1.6
+        fresh = [Student(s.student_id, s.name, s.email, s.age, s.gpa, s.credits,
+                         s.weight_kg, s.height_m) for s in students]
+        self.assertEqual([str(s) for s in students], [str(s) for s in fresh])
+
+
+class TestStudentIndex(unittest.TestCase):
+    def scan(self, students, gpa=None, credits=None, standing=None, full_time=None):
+        def keep(s):
+            return ((gpa is None or gpa[0] <= s.gpa <= gpa[1])
+                    and (credits is None or credits[0] <= s.credits <= credits[1])
+                    and (standing is None or s.standing == standing)
+                    and (full_time is None or (s.full_time_status == "Full-Time") == full_time))
+        return [s for s in students if keep(s)]
+
+    def test_queries_match_a_full_scan(self):
+        students = make_students()
+        index = StudentIndex(students)
+        for filters in ({"gpa": (3.0, 4.0)}, {"credits": (30, 59), "full_time": True},
+                        {"standing": "Junior", "gpa": (2.0, 3.5)}, {"full_time": False},
+                        {"gpa": (1.0, 1.0)}, {}):
+            self.assertEqual(index.query(**filters), self.scan(students, **filters))
+        self.assertEqual(len(index.query(gpa=(None, 2.0))), len(self.scan(students, gpa=(0, 2.0))))
+        self.assertEqual(index.count("standing", "Senior"), len(self.scan(students, standing="Senior")))
+
+    def test_setters_keep_indexes_current(self):
+        students = make_students()
+        index = StudentIndex(students)
+        for s in students[::3]:
+            s.gpa = 4.0
+            s.credits = 91
+        students[5].gpa = "2.5"
+        for filters in ({"gpa": (4.0, 4.0)}, {"standing": "Senior"}, {"gpa": (2.5, 2.5)},
+                        {"credits": (0, 11), "full_time": False}):
+            self.assertEqual(index.query(**filters), self.scan(students, **filters))
+        index.remove(students[0])
+        students[0].credits = 0
+        self.assertNotIn(students[0], index.query(credits=(0, 0)))
+        self.assertEqual(len(index), len(students) - 1)
+
+
+class TestStudentBulk(unittest.TestCase):
+    def raw_columns(self, n=50):
+        return {
+            "student_id": list(range(n)),
+            "name": [f"  student {i} " for i in range(n)],
+            "email": [f" s{i}@mail.harpercollege.edu" for i in range(n)],
+            "age": [18 + i % 40 for i in range(n)],
+            "gpa": [str((i * 7 % 401) / 100 + 0.004) for i in range(n)],
+            "credits": [i % 130 for i in range(n)],
+            "weight_kg": [None if i % 5 == 0 else 45.123 + i for i in range(n)],
+            "height_m": [None if i % 7 == 0 else 1.5 + i / 1000 for i in range(n)],
+        }
+
+    def test_same_objects_as_init(self):
+        cols = self.raw_columns()
+        students, errors = build_students(cols)
+        self.assertEqual(errors, [])
+        expected = [Student(*row) for row in zip(*cols.values())]
+        self.assertEqual([vars(s) for s in students], [vars(s) for s in expected])
+        self.assertEqual([list(vars(s)) for s in students], [list(vars(s)) for s in expected])
+        self.assertEqual([str(s) for s in students], [str(s) for s in expected])
+
+    def test_bad_rows_are_reported_and_dropped(self):
+        cols = self.raw_columns(10)
+        del cols["weight_kg"], cols["height_m"]
+        cols["gpa"][3] = 5.2
+        cols["email"][3] = "bad"
+        cols["age"][7] = "20"
+        students, errors = build_students(cols)
+        self.assertEqual([(e.row, e.field) for e in errors], [(4, "email"), (4, "gpa"), (8, "age")])
+        self.assertEqual(errors[1].message, "GPA must be between 0.0 and 4.0")
+        self.assertEqual([s.student_id for s in students], [0, 1, 2, 4, 5, 6, 8, 9])
+
+    def test_trusted_needs_matching_checksum(self):
+        original, _ = build_students(self.raw_columns())
+        cols, checksum = students_to_columns(original)
+        students, _ = build_students(cols, trusted=True, checksum=checksum)
+        self.assertEqual([vars(s) for s in students], [vars(s) for s in original])
+        cols["gpa"][0] = 9.9
+        with self.assertRaises(ValueError):
+            build_students(cols, trusted=True, checksum=checksum)
+
+
+class TestStudentIO(unittest.TestCase):
+    def setUp(self):
+        self.students = make_students(300)
+        self.students[1].name = "Zoë Ångström"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_jsonl_round_trip(self):
+        path = os.path.join(self.tmp.name, "roster.jsonl")
+        self.assertEqual(write_jsonl(iter(self.students), path), 300)
+        for trusted in (False, True):
+            loaded = read_jsonl(path, trusted=trusted)
+            self.assertEqual([vars(s) for s in loaded], [vars(s) for s in self.students])
+
+    def test_binary_round_trip_and_index(self):
+        path = os.path.join(self.tmp.name, "roster.bin")
+        self.assertEqual(write_binary(self.students, path), 300)
+        for trusted in (False, True):
+            loaded = read_binary(path, trusted=trusted)
+            self.assertEqual([vars(s) for s in loaded], [vars(s) for s in self.students])
+        with BinaryRoster(path) as roster:
+            self.assertEqual(len(roster), 300)
+            self.assertEqual(vars(roster[123]), vars(self.students[123]))
+            self.assertEqual(roster[-1].student_id, self.students[-1].student_id)
+            self.assertEqual([s.student_id for s in roster.iter_from(298)],
+                             [s.student_id for s in self.students[298:]])
+            with self.assertRaises(IndexError):
+                roster[300]
+
+    def test_truncated_binary(self):
+        path = os.path.join(self.tmp.name, "roster.bin")
+        write_binary(self.students[:3], path)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 2)
+        with self.assertRaises(ValueError):
+            list(read_binary(path))
+
+
+class TestGpaRank(unittest.TestCase):
+    def check_against_sort(self, index, students):
+        gpas = sorted(s.gpa for s in students)
+        for s in students[::7]:
+            above = sum(1 for g in gpas if g > s.gpa)
+            below = sum(1 for g in gpas if g < s.gpa)
+            ties = len(gpas) - above - below
+            self.assertEqual(index.rank(s), above + 1)
+            self.assertAlmostEqual(index.percentile(s), 100 * (below + ties / 2) / len(gpas))
+        for x in (0.0, 0.07, 1.5, 2.999, 3.0, 4.0, -1, 5):
+            self.assertEqual(index.count_above(x), sum(1 for g in gpas if g > x))
+            self.assertEqual(index.count_below(x), sum(1 for g in gpas if g < x))
+
+    def test_matches_sorting(self):
+        students = make_students()
+        index = GpaRankIndex(students)
+        self.assertEqual(len(index), len(students))
+        self.check_against_sort(index, students)
+
+    def test_keeps_students_from_a_generator(self):
+        index = GpaRankIndex(Student(i, f"student {i}", f"s{i}@mail.harpercollege.edu", 20,
+                                     (i % 401) / 100, 30) for i in range(1000))
+        self.assertEqual(len(index), 1000)
+        self.assertEqual(index.count_above(3.99), 2)     # 4.00 at i = 400 and 801
+
+    def test_follows_gpa_setter(self):
+        students = make_students()
+        index = GpaRankIndex(students)
+        for s in students[::4]:
+            s.gpa = 4.0
+        students[1].gpa = "0.29"
+        self.check_against_sort(index, students)
+        self.assertEqual(index.rank(4.0), 1)
+        index.remove(students[0])
+        students[0].gpa = 0.0
+        self.check_against_sort(index, students[1:])
+
+
+class TestSharedRoster(unittest.TestCase):
+    def test_atomic_updates_and_read_only_students(self):
+        students = make_students(50)
+        roster = SharedRoster(students)
+        before = roster.get(1010)
+        self.assertEqual(before.standing, "Freshman")
+        after = roster.update(1010, credits=95, gpa=3.25)
+        self.assertEqual((after.standing, after.gpa), ("Senior", 3.25))
+        self.assertEqual((before.standing, before.credits), ("Freshman", 10))   # old version intact
+        with self.assertRaises(AttributeError):
+            after.credits = 1
+        with self.assertRaises(ValueError):
+            roster.update_many({1011: {"credits": 40}, 1012: {"gpa": 5.0}})
+        self.assertEqual(roster.get(1011).credits, 11)          # nothing published
+        for field, value in (("standing", "Senior"), ("_gpa", 9.9), ("student_id", 1),
+                             ("_watchers", ())):
+            with self.assertRaises(AttributeError):
+                roster.update_many({1011: {field: value}})
+        self.assertEqual(roster.get(1011).gpa, students[11].gpa)
+        snap = roster.snapshot()
+        roster.remove(1011)
+        self.assertIn(1011, snap)
+        self.assertNotIn(1011, roster)
+        self.assertEqual(str(roster.get(1000)), str(students[0]))
+
+    def test_readers_never_see_half_an_update(self):
+        roster = SharedRoster(make_students(20))
+        roster.update(1005, credits=0, gpa=0)
+        stop = threading.Event()
+        seen = []
+
+        def reader():
+            while not stop.is_set():
+                s = roster.get(1005)
+                seen.append((s.credits, s.gpa))
+
+        t = threading.Thread(target=reader)
+        t.start()
+        for i in range(200):
+            roster.update(1005, credits=i, gpa=i / 100)
+        stop.set()
+        t.join()
+        self.assertTrue(seen)
+        self.assertTrue(all(gpa == credits / 100 for credits, gpa in seen))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
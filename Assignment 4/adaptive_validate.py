@@ -0,0 +1,106 @@
+"""
+CIS 216 – Assignment 4 (Validation), adaptive check order
+Author: Amtoj Singh
+
+validate_record() always checks name, email, age, balance, password,
+state and dates in that order. If most bad records fail on the password
+or the dates, they pay for every check in front of those first.
+
+AdaptiveValidator learns from the data instead:
+  - every `sample_every`-th record runs through an instrumented copy of
+    the compiled validator (validation_metrics) that evaluates every
+    check, so each one gets an unbiased failure rate (p) and cost (c)
+  - every `reorder_every` records the checks are sorted by c / p
+    (cheap checks that fail often go first), which is the order with
+    the lowest expected cost to reject a record, and the validator is
+    recompiled in that order
+
+Checks are independent of each other (every field is read up front and
+each check only looks at its own fields), so any order accepts and
+rejects exactly the same records. Only which reason a record with
+several problems reports first can change. In mode="all" every check
+runs anyway, so order cannot save anything there; the canonical order is
+kept and the reported reasons are exactly the normal ones.
+"""
+
+from validation_metrics import ValidationMetrics
+from validation_schema import (
+    SIGNUP_SCHEMA,
+    Schema,
+    ValidationErrors,
+    compile_schema,
+    rule_name,
+)
+
+
+class AdaptiveValidator:
+    def __init__(self, schema=SIGNUP_SCHEMA, mode="first", sample_every=32,
+                 reorder_every=20000, min_samples=100):
+        if sample_every <= 0 or reorder_every <= 0:
+            raise ValueError("sample_every and reorder_every must be > 0")
+        self.schema = schema
+        self.mode = mode
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self.min_samples = min_samples
+        self.metrics = ValidationMetrics()
+        self.order = list(schema.checks)
+        self.reorders = 0
+        self._calls = 0
+        self._compile()
+
+    def _compile(self):
+        ordered = Schema(self.schema.fields, self.order, self.schema.outputs)
+        self._fast = compile_schema(ordered, mode=self.mode, name="validate_adaptive")
+        self._sampled = compile_schema(ordered, mode="all", name="validate_adaptive",
+                                       metrics=self.metrics)
+
+    def __call__(self, rec):
+        self._calls += 1
+        if self._calls % self.sample_every:
+            return self._fast(rec)
+        if self.mode == "first" and self._calls % self.reorder_every < self.sample_every:
+            self.reorder()
+        try:
+            return self._sampled(rec)
+        except ValidationErrors as e:
+            if self.mode == "all":
+                raise
+            # errors are in current check order, so [0] is what _fast would raise
+            raise ValueError(e.errors[0]) from None
+
+    def check_stats(self):
+        """{check name: (samples, failure rate, seconds per evaluation)}"""
+        m = self.metrics
+        stats = {}
+        for check in self.schema.checks:
+            slots = [m.slot(rule_name(check, rule)) for rule in check.rules]
+            runs = m.evaluations[slots[0]]
+            fails = sum(m.failures[i] for i in slots)
+            secs = sum(m.seconds[i] for i in slots)
+            stats[check.name] = (runs, fails / runs if runs else 0.0,
+                                 secs / runs if runs else 0.0)
+        return stats
+
+    def reorder(self):
+        """Re-sort the checks by cost / failure rate; returns True if the order changed."""
+        stats = self.check_stats()
+        if min(runs for runs, _, _ in stats.values()) < self.min_samples:
+            return False
+
+        def rank(check):
+            _, p, c = stats[check.name]
+            return c / p if p else float("inf")
+
+        # sorted() is stable, so ties keep the schema's original order
+        new_order = sorted(self.schema.checks, key=rank)
+        if new_order == self.order:
+            return False
+        self.order = new_order
+        self.reorders += 1
+        self._compile()
+        return True
+
+    @property
+    def check_order(self):
+        return [check.name for check in self.order]
@@ -0,0 +1,344 @@
+"""
+CIS 216 – Assignment 4 (Validation), asyncio ingestion pipeline
+Author: Amtoj Singh
+
+Signup records arrive in bursts over local sockets, one JSON object per
+line. Instead of a synchronous validate loop (which either buffers
+without limit or drops connections), the work is split into three
+stages joined by bounded asyncio queues:
+
+    connections --> [in queue] --> validator tasks --> [out queue] --> writer
+      (reader)                     (process pool)                   (good/bad files)
+
+  - reader: one task per connection parses lines and awaits
+    in_queue.put(). When the queue is full it stops reading, the
+    socket's buffers fill up and the sender blocks: backpressure
+    reaches the client instead of piling up in memory.
+  - validators: each task takes up to `batch_size` waiting records and
+    hands them to a process pool (parallel_validate._validate_chunk),
+    so the CPU work never blocks the event loop.
+  - writer: writes good records as JSON Lines and rejects as
+    (record id, reason) CSV rows, like validate_stream().
+
+Failures:
+  - a batch that raises in the pool is written as rejects, one
+    "unexpected error: ..." per record like run_demo(), and the
+    pipeline goes on
+  - a worker that dies breaks a ProcessPoolExecutor for good. When the
+    pipeline made the pool itself it starts a fresh one and retries the
+    batch once (a batch that breaks the new pool too is rejected as
+    above). A pool the caller passed in is theirs to replace, so then
+    the pipeline stops
+  - if writing fails the output is no good any more, so it stops too
+  - stopping means the pipeline takes no more records (submit()
+    raises), throws away results still on their way, and close()
+    raises the error
+
+IngestMetrics tracks the depth of both queues and a histogram of
+end-to-end latency (line received -> result written).
+
+Run:
+    python async_ingest.py /tmp/signups.sock good.jsonl bad.csv
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+import csv
+import json
+import time
+
+from date_ingest import coerce_dates
+from parallel_validate import ChunkResult, _validate_chunk
+from stream_validate import StreamStats, to_json_line
+from validation_metrics import Histogram
+
+_STOP = object()   # end-of-input marker passed down the queues
+
+
+class QueueGauge:
+    """Current and highest depth of one queue."""
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.max_depth = 0
+
+    @property
+    def depth(self):
+        return self.queue.qsize()
+
+    def sample(self):
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+
+class IngestMetrics:
+    def __init__(self, in_queue, out_queue):
+        self.queues = {"in": QueueGauge(in_queue), "out": QueueGauge(out_queue)}
+        self.latency = Histogram((1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0))
+        self.received = 0
+        self.connections = 0
+
+    def to_dict(self):
+        return {
+            "received": self.received,
+            "connections": self.connections,
+            "queues": {name: {"depth": g.depth, "max_depth": g.max_depth}
+                       for name, g in self.queues.items()},
+            "latency_seconds": self.latency.to_dict(),
+        }
+
+    def to_prometheus(self, prefix="ingest"):
+        lines = [
+            f"# HELP {prefix}_records_received_total Records read from connections.",
+            f"# TYPE {prefix}_records_received_total counter",
+            f"{prefix}_records_received_total {self.received}",
+            f"# HELP {prefix}_queue_depth Records waiting in each queue.",
+            f"# TYPE {prefix}_queue_depth gauge",
+        ]
+        for name, g in self.queues.items():
+            lines.append(f'{prefix}_queue_depth{{queue="{name}"}} {g.depth}')
+        lines.append(f"# HELP {prefix}_queue_max_depth Highest depth seen for each queue.")
+        lines.append(f"# TYPE {prefix}_queue_max_depth gauge")
+        for name, g in self.queues.items():
+            lines.append(f'{prefix}_queue_max_depth{{queue="{name}"}} {g.max_depth}')
+
+        name = f"{prefix}_latency_seconds"
+        lines.append(f"# HELP {name} Time from a record being read to its result being written.")
+        lines.append(f"# TYPE {name} histogram")
+        for bound, n in self.latency.cumulative():
+            lines.append(f'{name}_bucket{{le="{bound}"}} {n}')
+        lines.append(f"{name}_sum {self.latency.sum}")
+        lines.append(f"{name}_count {self.latency.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _parse_line(line):
+    try:
+        rec = json.loads(line)
+    except ValueError as e:
+        return e   # reported as a reject, like read_records()
+    if isinstance(rec, dict):
+        coerce_dates(rec)
+    return rec
+
+
+class IngestPipeline:
+    """
+    Use as:
+        async with IngestPipeline(good_out, bad_out) as pipe:
+            server = await asyncio.start_unix_server(pipe.handle_connection, path)
+            ...
+    Leaving the block waits until every accepted record has been written.
+    """
+
+    def __init__(self, good_out, bad_out, workers=2, queue_size=10000, batch_size=500,
+                 executor=None):
+        if queue_size <= 0 or batch_size <= 0:
+            raise ValueError("queue_size and batch_size must be > 0")
+        self.good_out = good_out
+        self.bad_writer = csv.writer(bad_out)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.executor = executor
+        self._own_executor = executor is None
+        self.in_queue = asyncio.Queue(queue_size)    # (record id, record, received at)
+        self.out_queue = asyncio.Queue(max(1, queue_size // batch_size))   # (ChunkResult, times)
+        self.metrics = IngestMetrics(self.in_queue, self.out_queue)
+        self.stats = StreamStats()
+        self._tasks = []
+        self._writer_task = None
+        self._next_id = 0
+        self.error = None             # the error that stopped the pipeline
+        self.failed = asyncio.Event()
+
+    # --- lifecycle ---
+    async def start(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers)
+        self.bad_writer.writerow(["record_id", "reason"])
+        self._tasks = [asyncio.create_task(self._validate_loop()) for _ in range(self.workers)]
+        self._writer_task = asyncio.create_task(self._write_loop())
+        return self
+
+    async def close(self):
+        """Drain everything already accepted, then stop the stages."""
+        for _ in self._tasks:
+            await self.in_queue.put(_STOP)
+        await asyncio.gather(*self._tasks)
+        await self.out_queue.put(_STOP)
+        await self._writer_task
+        if self._own_executor:
+            self.executor.shutdown()
+        self.stats.seconds = time.perf_counter() - self.stats.started
+        if self.error is not None:
+            raise self.error
+        return self.stats
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # --- stage 1: reader ---
+    async def submit(self, rec_id, rec):
+        """Queue one record; waits while the pipeline is full."""
+        if self.error is not None:
+            raise RuntimeError("ingest pipeline stopped after an error") from self.error
+        if rec_id is None:
+            self._next_id += 1
+            rec_id = self._next_id
+        await self.in_queue.put((rec_id, rec, time.perf_counter()))
+        self.metrics.received += 1
+        self.metrics.queues["in"].sample()
+
+    async def feed(self, records):
+        """Queue (record id, record) pairs from any (async or plain) iterable."""
+        if hasattr(records, "__aiter__"):
+            async for rec_id, rec in records:
+                await self.submit(rec_id, rec)
+        else:
+            for rec_id, rec in records:
+                await self.submit(rec_id, rec)
+
+    async def handle_connection(self, reader, writer):
+        """asyncio server callback: JSON Lines in, "accepted N" back at EOF."""
+        self.metrics.connections += 1
+        peer = self.metrics.connections
+        accepted = 0
+        try:
+            async for line in reader:
+                if not line.strip():
+                    continue
+                accepted += 1
+                rec = _parse_line(line)
+                rec_id = rec.get("id") if isinstance(rec, dict) else None
+                await self.submit(rec_id or f"{peer}:{accepted}", rec)
+            writer.write(f"accepted {accepted}\n".encode())
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def _stop(self, error):
+        if self.error is None:
+            self.error = error
+            self.failed.set()
+
+    # --- stage 2: validators ---
+    async def _run_batch(self, records, ids):
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.executor
+            try:
+                return await loop.run_in_executor(executor, _validate_chunk, 0, 0, records, ids)
+            except BrokenExecutor as e:
+                if not self._own_executor:
+                    self._stop(e)
+                    raise
+                if self.executor is executor:    # the first task to notice replaces it
+                    executor.shutdown(wait=False)
+                    self.executor = ProcessPoolExecutor(self.workers)
+                if attempt:
+                    raise
+
+    async def _validate_loop(self):
+        queue = self.in_queue
+        done = False
+        while not done:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            while len(batch) < self.batch_size and not queue.empty():
+                item = queue.get_nowait()
+                if item is _STOP:
+                    done = True
+                    break
+                batch.append(item)
+            ids = [rec_id for rec_id, _, _ in batch]
+            records = [rec for _, rec, _ in batch]
+            times = [t for _, _, t in batch]
+            try:
+                result = await self._run_batch(records, ids)
+            except Exception as e:
+                result = ChunkResult(0, 0, [], [(rec_id, f"unexpected error: {e!r}")
+                                                for rec_id in ids])
+            await self.out_queue.put((result, times))
+            self.metrics.queues["out"].sample()
+
+    # --- stage 3: writer ---
+    async def _write_loop(self):
+        write_good = self.good_out.write
+        write_bad = self.bad_writer.writerow
+        observe = self.metrics.latency.observe
+        stats = self.stats
+        while True:
+            item = await self.out_queue.get()
+            if item is _STOP:
+                return
+            if self.error is not None:
+                continue   # stopped: results still on their way are thrown away
+            result, times = item
+            try:
+                for clean in result.good:
+                    write_good(to_json_line(clean) + "\n")
+                for row in result.bad:
+                    write_bad(row)
+            except Exception as e:
+                self._stop(e)
+                continue
+            stats.good += result.good_count
+            stats.bad += result.bad_count
+            now = time.perf_counter()
+            for t in times:
+                observe(now - t)
+
+
+async def serve(socket_path, good_path, bad_path, metrics_path=None, **kwargs):
+    """
+    Serve until cancelled (Ctrl-C) or until the pipeline stops; either one
+    propagates to the caller once the metrics and the summary are out.
+    """
+    with open(good_path, "w", encoding="utf-8") as good_out, \
+            open(bad_path, "w", newline="", encoding="utf-8") as bad_out:
+        pipe = IngestPipeline(good_out, bad_out, **kwargs)
+        try:
+            async with pipe:
+                server = await asyncio.start_unix_server(pipe.handle_connection, socket_path)
+                async with server:
+                    forever = asyncio.create_task(server.serve_forever())
+                    failed = asyncio.create_task(pipe.failed.wait())
+                    try:
+                        await asyncio.wait({forever, failed},
+                                           return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        forever.cancel()
+                        failed.cancel()
+        finally:
+            if metrics_path:
+                with open(metrics_path, "w", encoding="utf-8") as f:
+                    f.write(pipe.metrics.to_prometheus())
+            print(pipe.stats)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate signup records sent over a unix socket.")
+    parser.add_argument("socket", help="unix socket path to listen on")
+    parser.add_argument("good", help="where normalized good records go (JSON Lines)")
+    parser.add_argument("bad", help="where rejects go (CSV: record_id,reason)")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--metrics", metavar="PATH", help="write Prometheus metrics here on exit")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.socket, args.good, args.bad, args.metrics, workers=args.workers,
+                          queue_size=args.queue_size, batch_size=args.batch_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+CIS 216 – Assignment 4 (Validation), column-wise version
+Author: Amtoj Singh
+
+For bulk loads the data often already comes as columns (one list per
+field). Instead of calling validate_record() once per row, each rule is
+evaluated once over a whole column into a "fails" mask (a list of
+bools), and the masks are combined into one code per row: the code of
+the first rule that row breaks, in the same order validate_record()
+checks them, or 0 when the row is fine.
+
+RULE_MESSAGES[code] is the exact message validate_record() raises for
+that rule, so messages_for(codes) lines up with the scalar function.
+
+Expected columns (all the same length):
+    name, email, age, balance, password_len (or password), country,
+    state, start_date, end_date
+"""
+
+from datetime import date
+
+from email_validation import is_valid_email
+from reference_data import us_states
+
+OK = 0
+NAME_REQUIRED = 1
+EMAIL_INVALID = 2
+AGE_TYPE = 3
+AGE_RANGE = 4
+BALANCE_TYPE = 5
+BALANCE_NEGATIVE = 6
+PASSWORD_SHORT = 7
+STATE_INVALID = 8
+DATES_TYPE = 9
+DATES_ORDER = 10
+
+RULE_MESSAGES = (
+    None,
+    "name is required",
+    "email looks invalid",
+    "age must be an integer",
+    "age must be between 0 and 110",
+    "balance must be a number",
+    "balance cannot be negative",
+    "password must be at least 8 characters",
+    "state must be a valid 2-letter code for US in our list",
+    "start_date and end_date must be date objects",
+    "end_date must be on or after start_date",
+)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def rule_masks(cols):
+    """[(code, fails_mask), ...] in validate_record() order."""
+    names = [str(v).strip() for v in cols["name"]]
+    emails = [str(v).strip() for v in cols["email"]]
+    ages = cols["age"]
+    balances = [_to_float(v) for v in cols["balance"]]
+    if "password_len" in cols:
+        pw_lens = cols["password_len"]
+    else:
+        pw_lens = [len(str(v)) for v in cols["password"]]
+    countries = [str(v).upper() for v in cols["country"]]
+    states = [str(v).upper() for v in cols["state"]]
+    starts = cols["start_date"]
+    ends = cols["end_date"]
+
+    allowed_states = us_states()
+    int_age = [isinstance(a, int) for a in ages]
+    dates_ok = [isinstance(s, date) and isinstance(e, date) for s, e in zip(starts, ends)]
+
+    # later masks only matter where the earlier rule of the same field
+    # passed, so they are written to be safe (False) everywhere else
+    return [
+        (NAME_REQUIRED, [not n for n in names]),
+        (EMAIL_INVALID, [not is_valid_email(e) for e in emails]),
+        (AGE_TYPE, [not ok for ok in int_age]),
+        (AGE_RANGE, [ok and not (0 <= a <= 110) for ok, a in zip(int_age, ages)]),
+        (BALANCE_TYPE, [b is None for b in balances]),
+        (BALANCE_NEGATIVE, [b is not None and b < 0 for b in balances]),
+        (PASSWORD_SHORT, [n < 8 for n in pw_lens]),
+        (STATE_INVALID, [c == "US" and s not in allowed_states
+                         for c, s in zip(countries, states)]),
+        (DATES_TYPE, [not ok for ok in dates_ok]),
+        (DATES_ORDER, [ok and e < s for ok, s, e in zip(dates_ok, starts, ends)]),
+    ]
+
+
+def first_failures(cols):
+    """One rule code per row: the first rule it breaks, or OK (0)."""
+    masks = rule_masks(cols)
+    n = len(masks[0][1])
+    codes = [OK] * n
+    # walk the rules backwards so earlier rules overwrite later ones
+    for code, mask in reversed(masks):
+        codes = [code if bad else c for c, bad in zip(codes, mask)]
+    return codes
+
+
+def messages_for(codes):
+    """Codes -> validate_record() messages (None for rows that passed)."""
+    return [RULE_MESSAGES[c] for c in codes]
+
+
+def records_to_columns(records):
+    """Helper for tests/demos: list of record dicts -> dict of columns."""
+    keys = ("name", "email", "age", "balance", "password", "country", "state",
+            "start_date", "end_date")
+    defaults = {"age": None, "balance": None, "start_date": None, "end_date": None}
+    return {k: [rec.get(k, defaults.get(k, "")) for rec in records] for k in keys}
@@ -0,0 +1,66 @@
+"""
+CIS 216 – shared email checks
+Author: Amtoj Singh
+
+The email rules for the Assignment 4 validators:
+
+  is_valid_email(addr)   strict: same accept/reject as EMAIL_RE, but a
+                         cheap structural pre-check throws out obvious
+                         junk ("no @", "no dot after @") before the regex
+  DuplicateIndex         flags repeat signups in O(1) by normalized
+                         address (trimmed + lowercased)
+
+Only validate_record() and the validators built on the same rules
+(validation_schema, columnar_validate, stream_validate, signup_bloom)
+use this module. Employee.email (Assignment 6) and Student.email
+(Assignment 3) keep their own loose "has @ and a dot after it" check:
+each assignment folder is imported on its own, and a folder named
+"Assignment N" cannot be a package, so they have no clean way to reach
+this file.
+
+There is no cache of already-validated domains either. Splitting the
+address, looking the domain up and matching the local part took about
+450ns here, against about 280ns for the single regex.
+"""
+
+import re
+
+# basic pattern (kept simple on purpose)
+EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+
+_match = EMAIL_RE.match
+
+
+def is_valid_email(addr):
+    """True when addr matches EMAIL_RE (addr must be a str)."""
+    at = addr.find("@")
+    # the regex needs a non-empty local part and a dot somewhere after the "@"
+    if at < 1 or addr.find(".", at) < 0:
+        return False
+    return _match(addr) is not None
+
+
+def normalize_email(addr):
+    """Key used for duplicate checks: trimmed and lowercased."""
+    return addr.strip().lower()
+
+
+class DuplicateIndex:
+    """Remembers every normalized address it has seen (hash set, O(1) checks)."""
+
+    def __init__(self):
+        self._seen = set()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __contains__(self, addr):
+        return normalize_email(addr) in self._seen
+
+    def add(self, addr):
+        """Record addr; returns True if it was already there (a duplicate)."""
+        key = normalize_email(addr)
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        return False
@@ -0,0 +1,146 @@
+"""
+CIS 216 – Assignment 4 (Validation), multi-core version
+Author: Amtoj Singh
+
+validate_record() is pure CPU work, so big inputs can be split into
+chunks and validated in a process pool:
+  - at most `max_in_flight` chunks are queued at once, so reading a huge
+    file never runs far ahead of the workers (memory stays bounded),
+  - results come back chunk by chunk in input order,
+  - each ChunkResult carries its own good and bad counts.
+
+Inputs smaller than `min_parallel` records are validated in-process,
+because starting worker processes costs more than it saves there.
+
+Each chunk goes through the compiled batch validator from
+validation_schema (same output and messages as validate_record).
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from itertools import chain, islice
+import os
+import time
+
+from stream_validate import StreamStats, read_records, to_json_line
+from validation_schema import validate_signup_many
+
+
+class ChunkResult:
+    def __init__(self, index, start, good, bad):
+        self.index = index    # chunk number, 0-based
+        self.start = start    # input position of the chunk's first record
+        self.good = good      # normalized dicts, in input order
+        self.bad = bad        # (input position, reason), in input order
+
+    @property
+    def good_count(self):
+        return len(self.good)
+
+    @property
+    def bad_count(self):
+        return len(self.bad)
+
+
+def _validate_chunk(index, start, records, ids=None):
+    """
+    Worker side: validate one chunk. Bad entries get the absolute input
+    position, or the caller's record id when ids were passed along.
+    """
+    good, bad = validate_signup_many(records)
+    # read_records() passes unparseable lines through as exceptions
+    bad = [(i, f"unreadable record: {records[i]}" if isinstance(records[i], Exception) else reason)
+           for i, reason in bad]
+    if ids is None:
+        bad = [(start + i, reason) for i, reason in bad]
+    else:
+        bad = [(ids[i], reason) for i, reason in bad]
+    return ChunkResult(index, start, good, bad)
+
+
+def _chunks(records, chunk_size, with_ids):
+    it = iter(records)
+    start = 0
+    index = 0
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        if with_ids:
+            ids = [rec_id for rec_id, _ in chunk]
+            chunk = [rec for _, rec in chunk]
+            yield index, start, chunk, ids
+        else:
+            yield index, start, chunk
+        start += len(chunk)
+        index += 1
+
+
+def run_chunks(records, chunk_size=50000, workers=None, max_in_flight=None,
+               min_parallel=200000, with_ids=False):
+    """
+    Yield a ChunkResult per chunk, in input order. With with_ids=True the
+    input is (record_id, record) pairs, as produced by read_records().
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    chunks = _chunks(records, chunk_size, with_ids)
+
+    # look ahead far enough to know whether a pool is worth it
+    head = []
+    seen = 0
+    for chunk in chunks:
+        head.append(chunk)
+        seen += len(chunk[2])
+        if seen >= min_parallel:
+            break
+    if seen < min_parallel or workers == 1:
+        for chunk in head:
+            yield _validate_chunk(*chunk)
+        for chunk in chunks:
+            yield _validate_chunk(*chunk)
+        return
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chain(head, chunks):
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_validate_chunk, *chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def validate_all(records, **kwargs):
+    """
+    Convenience wrapper: returns (good, bad, counts) where counts is a list
+    of (chunk index, good count, bad count).
+    """
+    good = []
+    bad = []
+    counts = []
+    for result in run_chunks(records, **kwargs):
+        good.extend(result.good)
+        bad.extend(result.bad)
+        counts.append((result.index, result.good_count, result.bad_count))
+    return good, bad, counts
+
+
+def validate_file_parallel(in_path, good_path, bad_path, fmt=None, **kwargs):
+    """Like stream_validate.validate_file(), but chunks run in the pool."""
+    stats = StreamStats()
+    with open(good_path, "w", encoding="utf-8", buffering=1 << 20) as good_out, \
+            open(bad_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as bad_out:
+        bad_writer = csv.writer(bad_out)
+        bad_writer.writerow(["record_id", "reason"])
+        records = read_records(in_path, fmt)
+        for result in run_chunks(records, with_ids=True, **kwargs):
+            good_out.writelines(to_json_line(clean) + "\n" for clean in result.good)
+            bad_writer.writerows(result.bad)
+            stats.good += result.good_count
+            stats.bad += result.bad_count
+    stats.seconds = time.perf_counter() - stats.started
+    return stats
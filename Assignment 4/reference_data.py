@@ -0,0 +1,113 @@
+"""
+CIS 216 – Assignment 4 (Validation), reference-data tables
+Author: Amtoj Singh
+
+Code tables (US states, Canadian provinces, country codes, postal-code
+prefixes) live as small text files in refdata/ instead of hardcoded
+sets. File format, one entry per line:
+    CODE
+    CODE,label
+Blank lines and lines starting with "#" are ignored.
+
+Each table is loaded into a frozenset of codes (plus a dict of labels).
+ReferenceData.table(name) is the read path: it hands back the current
+frozenset and, at most once every `check_interval` seconds, looks at
+the file's mtime. If the file changed, a new table is built off to the
+side and swapped in with a single assignment, so concurrent readers see
+either the old table or the new one, never a half-loaded one. A file
+that fails to load leaves the old table in place.
+"""
+
+import os
+import threading
+import time
+
+REFDATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "refdata")
+
+
+class CodeTable:
+    def __init__(self, name, codes, labels, mtime):
+        self.name = name
+        self.codes = codes      # frozenset of upper-case codes
+        self.labels = labels    # code -> label ("" when the file has none)
+        self.mtime = mtime
+
+    @classmethod
+    def from_file(cls, name, path):
+        mtime = os.stat(path).st_mtime_ns
+        labels = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                code, _, label = line.partition(",")
+                labels[code.strip().upper()] = label.strip()
+        return cls(name, frozenset(labels), labels, mtime)
+
+
+class ReferenceData:
+    def __init__(self, directory=REFDATA_DIR, check_interval=1.0):
+        self.directory = directory
+        self.check_interval = check_interval
+        self._tables = {}       # name -> CodeTable
+        self._next_check = {}   # name -> monotonic time of the next mtime check
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name + ".txt")
+
+    def _load(self, name):
+        with self._lock:
+            current = self._tables.get(name)
+            try:
+                mtime = os.stat(self._path(name)).st_mtime_ns
+                if current is None or mtime != current.mtime:
+                    current = CodeTable.from_file(name, self._path(name))
+                    self._tables[name] = current   # the atomic swap
+            except (OSError, ValueError):   # missing, unreadable or not UTF-8
+                if current is None:
+                    raise
+            self._next_check[name] = time.monotonic() + self.check_interval
+            return current
+
+    def get(self, name):
+        """The current CodeTable for name (reloaded if its file changed)."""
+        table = self._tables.get(name)
+        if table is None or time.monotonic() >= self._next_check.get(name, 0.0):
+            table = self._load(name)
+        return table
+
+    def table(self, name):
+        """The current set of codes for name."""
+        return self.get(name).codes
+
+    def label(self, name, code):
+        return self.get(name).labels.get(code.upper())
+
+    def reload(self, name=None):
+        """Force an mtime check now (all loaded tables when name is None)."""
+        for n in [name] if name else list(self._tables):
+            self._next_check[n] = 0.0
+            self.get(n)
+
+
+# shared instance used by the validators
+REFERENCE = ReferenceData()
+
+
+def us_states():
+    return REFERENCE.table("us_states")
+
+
+def ca_provinces():
+    return REFERENCE.table("ca_provinces")
+
+
+def country_codes():
+    return REFERENCE.table("countries")
+
+
+def ca_province_for_postal(postal_code):
+    """Province code for a Canadian postal code, from its first letter."""
+    return REFERENCE.label("ca_postal_prefixes", postal_code.strip()[:1])
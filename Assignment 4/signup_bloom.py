@@ -0,0 +1,172 @@
+"""
+CIS 216 – Assignment 4 (Validation), duplicate signups at scale
+Author: Amtoj Singh
+
+An exact set of every email ever registered does not fit in memory once
+there are hundreds of millions of them. A Bloom filter answers "have we
+maybe seen this?" in a few bytes per address:
+  - "no"  is always right, so new signups never touch the disk
+  - "yes" can be a false positive, so only then do we ask the exact
+    on-disk store (an SQLite table) to confirm
+
+The filter can be saved to a file and loaded back with mmap, so a
+validator process starts in milliseconds instead of re-reading history.
+The saved filter must cover every address in the store, or a restarted
+validator answers "no" for addresses it added last time and never asks
+the disk. So a DuplicateDetector given bloom_path saves the filter on
+every commit(), just before the SQLite commit. A crash in between can
+only leave extra bits in the filter (a few more disk checks), never
+missing ones. Saving writes the whole filter, so size commit_every with
+that in mind.
+
+Sizing (standard formulas): for n items and false-positive rate p
+    bits   m = -n * ln(p) / ln(2)^2
+    hashes k = m / n * ln(2)
+"""
+
+from hashlib import blake2b
+import math
+import mmap
+import os
+import sqlite3
+import struct
+
+from email_validation import normalize_email
+
+_MAGIC = b"BLM1"
+_HEADER = struct.Struct("<4sQQQ")   # magic, bits, hashes, items added
+
+
+class BloomFilter:
+    def __init__(self, capacity, fp_rate=0.01):
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not (0 < fp_rate < 1):
+            raise ValueError("fp_rate must be between 0 and 1")
+        m = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+        self.num_bits = max(m, 8)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._mmap = None
+
+    def _positions(self, key):
+        digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key):
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        bits = self._bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    # --- persistence ---
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.count))
+            f.write(self._bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Load a saved filter. With use_mmap the bit array is mapped
+        copy-on-write: startup is instant, pages load on demand, and
+        later add() calls stay private to this process until save().
+        """
+        with open(path, "rb") as f:
+            magic, num_bits, num_hashes, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a saved BloomFilter")
+            obj = cls.__new__(cls)
+            obj.num_bits, obj.num_hashes, obj.count = num_bits, num_hashes, count
+            if use_mmap:
+                obj._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                obj._bits = memoryview(obj._mmap)[_HEADER.size:]
+            else:
+                obj._bits = bytearray(f.read())
+                obj._mmap = None
+        if len(obj._bits) != (num_bits + 7) // 8:
+            obj.close()
+            raise ValueError(f"{path} is truncated")
+        return obj
+
+    def close(self):
+        if self._mmap is not None:
+            self._bits.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+class DuplicateDetector:
+    """
+    Bloom filter in front of an exact SQLite store of normalized emails.
+    check_and_add(email) -> True when the address was registered before.
+    Pass bloom_path (where the filter was loaded from) so commits save it.
+    """
+
+    def __init__(self, bloom, db_path, commit_every=10000, bloom_path=None):
+        self.bloom = bloom
+        self.bloom_path = bloom_path
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS emails (email TEXT PRIMARY KEY)")
+        self.commit_every = commit_every
+        self._uncommitted = 0
+        self.disk_checks = 0      # how often the filter said "maybe"
+        self.false_positives = 0  # ...and the disk said "no"
+
+    def _insert(self, key):
+        self.db.execute("INSERT OR IGNORE INTO emails (email) VALUES (?)", (key,))
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.commit()
+
+    def check_and_add(self, email):
+        key = normalize_email(email)
+        if key in self.bloom:
+            self.disk_checks += 1
+            row = self.db.execute("SELECT 1 FROM emails WHERE email = ?", (key,)).fetchone()
+            if row is not None:
+                return True
+            self.false_positives += 1
+        else:
+            self.bloom.add(key)
+        self._insert(key)
+        return False
+
+    # same interface as email_validation.DuplicateIndex, so it can be
+    # passed to stream_validate.validate_stream(dedupe=...)
+    add = check_and_add
+
+    def load_history(self, emails):
+        """Seed filter and store from past signups (no duplicate checks)."""
+        for email in emails:
+            key = normalize_email(email)
+            self.bloom.add(key)
+            self._insert(key)
+        self.commit()
+
+    def commit(self):
+        """Make every address added so far durable: the filter first, then the store."""
+        if self.bloom_path is not None:
+            self.bloom.save(self.bloom_path)
+        self.db.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        self.commit()
+        self.db.close()
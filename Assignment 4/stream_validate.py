@@ -0,0 +1,190 @@
+"""
+CIS 216 – Assignment 4 (Validation), streaming version
+Author: Amtoj Singh
+
+run_demo() keeps every record plus the good and bad lists in memory.
+For big signup backfills this module streams instead:
+  - records are read one at a time from a JSON Lines or CSV file,
+  - ISO date strings ("2025-09-01") are turned into date objects
+    (date_ingest, cached),
+  - each record goes through validate_record(),
+  - good records are written (normalized, as JSON Lines) and rejects are
+    written as (record id, reason) CSV rows right away.
+Memory use stays flat no matter how big the input is, and a progress
+line with rows/second is printed every `report_every` rows.
+
+Run:
+    python stream_validate.py signups.jsonl good.jsonl bad.csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+
+from date_ingest import DATE_FIELDS, coerce_dates
+from email_validation import DuplicateIndex
+from validation_demo import validate_record
+
+
+def _coerce_csv(rec):
+    # CSV gives us strings for everything; age has to be an int to pass
+    age = rec.get("age")
+    if isinstance(age, str):
+        try:
+            rec["age"] = int(age)
+        except ValueError:
+            pass
+    return rec
+
+
+def read_records(path, fmt=None):
+    """Yield (record_id, record) lazily from a .jsonl or .csv file."""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            for n, rec in enumerate(csv.DictReader(f), start=1):
+                yield rec.get("id") or n, coerce_dates(_coerce_csv(rec))
+        elif fmt == "jsonl":
+            for n, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError as e:
+                    yield n, e  # reported as a reject, does not stop the run
+                    continue
+                if isinstance(rec, dict):
+                    coerce_dates(rec)
+                    yield rec.get("id") or n, rec
+                else:
+                    yield n, rec
+        else:
+            raise ValueError("fmt must be 'jsonl' or 'csv'")
+
+
+def to_json_line(clean):
+    """One normalized record as a JSON string (dates as ISO text)."""
+    out = dict(clean)
+    for key in DATE_FIELDS:
+        out[key] = out[key].isoformat()
+    return json.dumps(out, ensure_ascii=False)
+
+
+class StreamStats:
+    def __init__(self):
+        self.good = 0
+        self.bad = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def total(self):
+        return self.good + self.bad
+
+    @property
+    def rows_per_sec(self):
+        return self.total / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"Summary: {self.good} good, {self.bad} bad, total {self.total} "
+                f"({self.rows_per_sec:,.0f} rows/s)")
+
+
+def _print_progress(stats):
+    elapsed = time.perf_counter() - stats.started
+    rate = stats.total / elapsed if elapsed else 0.0
+    print(f"... {stats.total:,} rows ({stats.good:,} good, {stats.bad:,} bad) "
+          f"{rate:,.0f} rows/s", file=sys.stderr)
+
+
+def validate_stream(records, good_out, bad_out, validator=validate_record,
+                    report_every=100000, progress=_print_progress, dedupe=None):
+    """
+    records: iterable of (record_id, record).
+    good_out: text file for normalized JSON Lines; bad_out: text file for CSV rejects.
+    dedupe: optional DuplicateIndex; a valid record whose email was already
+    seen is rejected as a duplicate signup.
+    """
+    stats = StreamStats()
+    bad_writer = csv.writer(bad_out)
+    bad_writer.writerow(["record_id", "reason"])
+    write_good = good_out.write
+    write_bad = bad_writer.writerow
+
+    for rec_id, rec in records:
+        if isinstance(rec, Exception):
+            write_bad([rec_id, f"unreadable record: {rec}"])
+            stats.bad += 1
+        else:
+            try:
+                clean = validator(rec)
+            except ValueError as e:
+                write_bad([rec_id, str(e)])
+                stats.bad += 1
+            except Exception as e:
+                write_bad([rec_id, f"unexpected error: {e!r}"])
+                stats.bad += 1
+            else:
+                if dedupe is not None and dedupe.add(clean["email"]):
+                    write_bad([rec_id, "email already registered"])
+                    stats.bad += 1
+                else:
+                    write_good(to_json_line(clean) + "\n")
+                    stats.good += 1
+        if progress and report_every and stats.total % report_every == 0:
+            progress(stats)
+
+    stats.seconds = time.perf_counter() - stats.started
+    return stats
+
+
+def validate_file(in_path, good_path, bad_path, fmt=None, **kwargs):
+    """validate_stream() from one file into two output files."""
+    with open(good_path, "w", encoding="utf-8", buffering=1 << 20) as good_out, \
+            open(bad_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as bad_out:
+        return validate_stream(read_records(in_path, fmt), good_out, bad_out, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream-validate signup records.")
+    parser.add_argument("input", help=".jsonl or .csv file of signup records")
+    parser.add_argument("good", help="where normalized good records go (JSON Lines)")
+    parser.add_argument("bad", help="where rejects go (CSV: record_id,reason)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None)
+    parser.add_argument("--report-every", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="validate in a pool of this many processes")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="write per-rule metrics here (.prom = Prometheus text, else JSON)")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="reject repeat signups of the same email (single process only)")
+    args = parser.parse_args(argv)
+    if (args.dedupe or args.metrics) and args.workers > 1:
+        parser.error("--dedupe and --metrics need --workers 1")
+
+    metrics = None
+    validator = validate_record
+    if args.metrics:
+        from validation_metrics import ValidationMetrics
+        from validation_schema import instrumented_signup_validator
+        metrics = ValidationMetrics()
+        validator = instrumented_signup_validator(metrics)
+
+    if args.workers > 1:
+        from parallel_validate import validate_file_parallel
+        stats = validate_file_parallel(args.input, args.good, args.bad, fmt=args.format,
+                                       workers=args.workers)
+    else:
+        stats = validate_file(args.input, args.good, args.bad, fmt=args.format,
+                              report_every=args.report_every, validator=validator,
+                              dedupe=DuplicateIndex() if args.dedupe else None)
+    print(stats)
+    if metrics is not None:
+        with open(args.metrics, "w", encoding="utf-8") as f:
+            f.write(metrics.to_prometheus() if args.metrics.endswith(".prom") else metrics.to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,518 @@
+"""
+Unit tests for Assignment 4 — validation helpers
+
+Run:
+    python -m unittest discover -s "Assignment 4" -v
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from datetime import date
+
+from adaptive_validate import AdaptiveValidator
+from async_ingest import IngestPipeline
+from columnar_validate import first_failures, messages_for, records_to_columns
+from date_ingest import DATE_ERROR, coerce_dates, parse_date, parse_date_column
+from email_validation import EMAIL_RE, DuplicateIndex, is_valid_email
+from parallel_validate import validate_all, validate_file_parallel
+from reference_data import ReferenceData, ca_province_for_postal, country_codes, us_states
+from signup_bloom import BloomFilter, DuplicateDetector
+from stream_validate import read_records, validate_file, validate_stream
+from validation_cache import CachedValidator, record_key
+from validation_demo import validate_record
+from validation_metrics import ValidationMetrics
+from validation_schema import (
+    SIGNUP_SCHEMA,
+    ValidationErrors,
+    compile_schema,
+    instrumented_signup_validator,
+    validate_signup,
+    validate_signup_all,
+    validate_signup_many,
+)
+
+
+class CrashingRecord(dict):
+    """Kills the worker process that validates it."""
+
+    def get(self, *args):
+        os._exit(1)
+
+
+def make_record(**changes):
+    rec = {
+        "name": "  Amtoj Singh ",
+        "email": "sa48190@mail.harpercollege.edu",
+        "age": 24,
+        "balance": "125.755",
+        "password": "StrongPass1",
+        "country": "us",
+        "state": "il",
+        "start_date": date(2025, 9, 1),
+        "end_date": date(2025, 12, 15),
+    }
+    rec.update(changes)
+    return rec
+
+
+# one record per rule (plus a few that break several rules at once)
+SAMPLES = [
+    make_record(),
+    make_record(balance=0.29),
+    make_record(balance=10**15 + 0.5),
+    make_record(balance=100.0),
+    make_record(balance=-0.0),
+    make_record(balance=1e300),
+    make_record(balance=float("inf")),
+    make_record(country="CA", state="zz"),
+    make_record(name="   "),
+    make_record(email="not-an-email"),
+    make_record(email="a@b.c"),
+    make_record(age="24"),
+    make_record(age=200),
+    make_record(balance="lots"),
+    make_record(balance=-3.14),
+    make_record(password="short"),
+    make_record(state="CA"),
+    make_record(state="ZZ"),
+    make_record(start_date="2025-09-01"),
+    make_record(end_date=date(2025, 8, 1)),
+    make_record(age=-1, password="x", end_date=date(2025, 8, 1)),
+]
+
+
+def outcome(fn, rec):
+    try:
+        return ("ok", fn(rec))
+    except ValueError as e:
+        return ("bad", str(e))
+
+
+class TestCompiledSchema(unittest.TestCase):
+    def test_first_error_matches_validate_record(self):
+        for rec in SAMPLES:
+            self.assertEqual(outcome(validate_signup, rec), outcome(validate_record, rec))
+
+    def test_all_errors_mode(self):
+        rec = make_record(age=-1, password="x", end_date=date(2025, 8, 1))
+        with self.assertRaises(ValidationErrors) as ctx:
+            validate_signup_all(rec)
+        self.assertEqual(ctx.exception.errors, [
+            "age must be between 0 and 110",
+            "password must be at least 8 characters",
+            "end_date must be on or after start_date",
+        ])
+        self.assertEqual(validate_signup_all(SAMPLES[0]), validate_record(SAMPLES[0]))
+
+    def test_batch_matches_loop(self):
+        good, bad = validate_signup_many(SAMPLES + [None])
+        expected = [outcome(validate_record, rec) for rec in SAMPLES]
+        self.assertEqual(good, [v for kind, v in expected if kind == "ok"])
+        self.assertEqual(bad[:-1], [(i, v) for i, (kind, v) in enumerate(expected) if kind == "bad"])
+        self.assertTrue(bad[-1][1].startswith("unexpected error"))
+
+
+class TestStreamValidate(unittest.TestCase):
+    def test_jsonl_and_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "in.jsonl")
+            with open(src, "w") as f:
+                f.write(json.dumps({"id": "a1", **make_record(start_date="2025-09-01",
+                                                              end_date="2025-12-15")}) + "\n")
+                f.write(json.dumps(make_record(start_date="2025-09-01", end_date="soon")) + "\n")
+                f.write("{not json\n")
+            good, bad = os.path.join(tmp, "good.jsonl"), os.path.join(tmp, "bad.csv")
+            stats = validate_file(src, good, bad, progress=None)
+            self.assertEqual((stats.good, stats.bad), (1, 2))
+            with open(good) as f:
+                self.assertEqual(json.loads(f.readline())["start_date"], "2025-09-01")
+            with open(bad) as f:
+                rows = f.read().splitlines()
+            self.assertEqual(rows[1], "2,start_date and end_date must be date objects")
+            self.assertTrue(rows[2].startswith("3,unreadable record"))
+
+            src = os.path.join(tmp, "in.csv")
+            with open(src, "w") as f:
+                f.write("name,email,age,balance,password,country,state,start_date,end_date\n")
+                f.write("Ann,ann@x.com,30,5,abcdefgh,US,IL,2025-01-01,2025-02-01\n")
+            recs = list(read_records(src))
+            self.assertEqual(recs[0][1]["age"], 30)
+            good_out, bad_out = io.StringIO(), io.StringIO()
+            self.assertEqual(validate_stream(recs, good_out, bad_out, progress=None).good, 1)
+
+
+class TestParallelValidate(unittest.TestCase):
+    def test_order_and_counts(self):
+        records = SAMPLES * 3
+        expected = validate_signup_many(records)
+        for workers in (1, 2):
+            good, bad, counts = validate_all(records, chunk_size=5, workers=workers, min_parallel=0)
+            self.assertEqual((good, bad), expected)
+            self.assertEqual(len(counts), -(-len(records) // 5))
+            self.assertEqual(sum(c[1] for c in counts), len(good))
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "in.jsonl")
+            with open(src, "w") as f:
+                f.write(json.dumps({"id": "x9", **make_record(password="short",
+                                    start_date="2025-09-01", end_date="2025-12-15")}) + "\n")
+                f.write("{not json\n")
+            bad = os.path.join(tmp, "bad.csv")
+            stats = validate_file_parallel(src, os.path.join(tmp, "good.jsonl"), bad,
+                                           workers=2, min_parallel=0, chunk_size=1)
+            self.assertEqual(stats.bad, 2)
+            with open(bad) as f:
+                rows = f.read().splitlines()
+            self.assertEqual(rows[1], "x9,password must be at least 8 characters")
+            self.assertTrue(rows[2].startswith("2,unreadable record"))
+
+
+class TestColumnarValidate(unittest.TestCase):
+    def test_codes_match_scalar_messages(self):
+        msgs = messages_for(first_failures(records_to_columns(SAMPLES)))
+        expected = [None if kind == "ok" else v
+                    for kind, v in (outcome(validate_record, rec) for rec in SAMPLES)]
+        self.assertEqual(msgs, expected)
+
+
+class TestEmailValidation(unittest.TestCase):
+    def test_strict_matches_regex(self):
+        for addr in ["a@b.co", "@b.co", "a@b", "a@.co", "a.b@c", "a@b.c", "a@@b.co",
+                     "x_y+z%@mail.sub.edu", "a@b.co\n", "a b@c.com", ""]:
+            self.assertEqual(is_valid_email(addr), EMAIL_RE.match(addr) is not None, addr)
+
+    def test_duplicates(self):
+        index = DuplicateIndex()
+        self.assertFalse(index.add("Ann@X.com"))
+        self.assertTrue(index.add("  ann@x.COM "))
+        out = io.StringIO()
+        recs = [(1, make_record()), (2, make_record(email="SA48190@mail.harpercollege.edu"))]
+        stats = validate_stream(recs, io.StringIO(), out, progress=None, dedupe=DuplicateIndex())
+        self.assertEqual((stats.good, stats.bad), (1, 1))
+        self.assertIn("2,email already registered", out.getvalue())
+
+
+class TestSignupBloom(unittest.TestCase):
+    def test_filter_roundtrip_and_detector(self):
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(500):
+            bloom.add(f"user{i}@x.com")
+        self.assertTrue(all(f"user{i}@x.com" in bloom for i in range(500)))
+        misses = sum(f"other{i}@x.com" in bloom for i in range(2000))
+        self.assertLess(misses, 60)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "signups.bloom")
+            bloom.save(path)
+            loaded = BloomFilter.load(path)
+            self.assertIn("user7@x.com", loaded)
+            self.assertEqual(len(loaded), 500)
+
+            det = DuplicateDetector(loaded, os.path.join(tmp, "emails.db"))
+            det.load_history(["Old@X.com"])
+            self.assertTrue(det.check_and_add(" old@x.com"))
+            self.assertFalse(det.check_and_add("user7@x.com"))  # filter hit, not on disk
+            self.assertTrue(det.add("USER7@x.com"))
+            self.assertEqual(det.false_positives, 1)
+            det.close()
+            loaded.close()
+
+    def test_restart_remembers_new_addresses(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "signups.bloom")
+            db_path = os.path.join(tmp, "emails.db")
+            BloomFilter(1000, 0.01).save(path)
+            for restart in range(2):
+                bloom = BloomFilter.load(path)
+                det = DuplicateDetector(bloom, db_path, bloom_path=path)
+                self.assertEqual(det.check_and_add("new@x.com"), restart == 1)
+                det.close()
+                bloom.close()
+            self.assertEqual(len(BloomFilter.load(path, use_mmap=False)), 1)
+
+
+class TestReferenceData(unittest.TestCase):
+    def test_shipped_tables(self):
+        self.assertIn("CA", us_states())
+        self.assertNotIn("ZZ", us_states())
+        self.assertEqual(len(country_codes()), 249)
+        self.assertEqual(ca_province_for_postal("m5v 2t6"), "ON")
+
+    def test_hot_reload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "colors.txt")
+            with open(path, "w") as f:
+                f.write("# test table\nRD,Red\ngn\n")
+            ref = ReferenceData(tmp, check_interval=0)
+            old = ref.table("colors")
+            self.assertEqual(old, frozenset({"RD", "GN"}))
+            with open(path, "w") as f:
+                f.write("BL,Blue\n")
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self.assertEqual(ref.table("colors"), frozenset({"BL"}))
+            self.assertEqual(ref.label("colors", "bl"), "Blue")
+            self.assertEqual(old, frozenset({"RD", "GN"}))  # readers' copy untouched
+            os.remove(path)
+            self.assertEqual(ref.table("colors"), frozenset({"BL"}))  # keeps last good table
+
+    def test_bad_file_keeps_last_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "colors.txt")
+            with open(path, "w") as f:
+                f.write("RD,Red\n")
+            ref = ReferenceData(tmp, check_interval=60)
+            self.assertEqual(ref.table("colors"), frozenset({"RD"}))
+            with open(path, "wb") as f:
+                f.write(b"GN,Gr\xfcn\n")      # Latin-1, not UTF-8
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            ref._next_check["colors"] = 0.0
+            self.assertEqual(ref.table("colors"), frozenset({"RD"}))
+            self.assertGreater(ref._next_check["colors"], time.monotonic())  # not retried every call
+            with self.assertRaises(ValueError):
+                ReferenceData(tmp).table("colors")   # nothing good to fall back on
+
+
+class TestValidationMetrics(unittest.TestCase):
+    def test_rule_counts_and_exports(self):
+        metrics = ValidationMetrics()
+        validate = instrumented_signup_validator(metrics)
+        for rec in SAMPLES:
+            self.assertEqual(outcome(validate, rec), outcome(validate_record, rec))
+        stats = metrics.rule_stats()
+        self.assertEqual(stats["name.Required"]["evaluations"], len(SAMPLES))
+        self.assertEqual(stats["password.MinLength"]["failures"], 1)
+        self.assertEqual(metrics.good + metrics.bad, len(SAMPLES))
+        self.assertEqual(metrics.latency.count, len(SAMPLES))
+        self.assertIn('validation_rule_failures_total{rule="email.Predicate"} 2',
+                      metrics.to_prometheus())
+        self.assertEqual(json.loads(metrics.to_json())["records"]["good"], metrics.good)
+
+    def test_all_mode_counts_every_failure(self):
+        metrics = ValidationMetrics()
+        validate = compile_schema(SIGNUP_SCHEMA, mode="all", metrics=metrics)
+        with self.assertRaises(ValidationErrors):
+            validate(make_record(age=-1, password="x"))
+        self.assertEqual(metrics.rule_stats()["age.InRange"]["failures"], 1)
+        self.assertEqual(metrics.rule_stats()["dates.Ordered"]["evaluations"], 1)
+
+
+class TestAdaptiveValidator(unittest.TestCase):
+    def test_reorders_without_changing_verdicts(self):
+        validate = AdaptiveValidator(sample_every=2, reorder_every=200, min_samples=20)
+        records = [make_record(password="short") if i % 10 else make_record() for i in range(600)]
+        records += SAMPLES
+        for rec in records:
+            got, want = outcome(validate, rec), outcome(validate_record, rec)
+            self.assertEqual(got[0], want[0])
+            if got[0] == "ok":
+                self.assertEqual(got, want)
+        self.assertGreaterEqual(validate.reorders, 1)
+        self.assertEqual(validate.check_order[0], "password")
+
+    def test_all_mode_keeps_reasons(self):
+        validate = AdaptiveValidator(mode="all", sample_every=1, reorder_every=1, min_samples=1)
+        rec = make_record(age=-1, password="x", end_date=date(2025, 8, 1))
+        for _ in range(5):
+            with self.assertRaises(ValidationErrors) as ctx:
+                validate(rec)
+        self.assertEqual(ctx.exception.errors[0], "age must be between 0 and 110")
+
+
+class TestValidationCache(unittest.TestCase):
+    def test_same_results_and_hits_on_resubmit(self):
+        validate = CachedValidator()
+        for _ in range(3):
+            for rec in SAMPLES:
+                self.assertEqual(outcome(validate, rec), outcome(validate_record, rec))
+        self.assertEqual(validate.misses, len(SAMPLES))
+        self.assertEqual(validate.hits, 2 * len(SAMPLES))
+        self.assertAlmostEqual(validate.stats()["hit_rate"], 2 / 3)
+
+    def test_key_tells_types_apart(self):
+        self.assertEqual(record_key(make_record()), record_key(make_record()))
+        self.assertNotEqual(record_key(make_record(age="24")), record_key(make_record()))
+        self.assertNotEqual(record_key(make_record(age=24.0)), record_key(make_record()))
+        self.assertNotEqual(record_key(make_record(age=True)), record_key(make_record(age=1)))
+        key = record_key(make_record())
+        self.assertNotIn("StrongPass1", key)                    # only a digest of it
+        self.assertNotEqual(key, record_key(make_record(password="StrongPass2")))
+        validate = CachedValidator()
+        validate(make_record(age=1))
+        with self.assertRaises(ValueError):
+            validate(make_record(age=1.0))      # not served from age=1's entry
+
+    def test_version_checked_every_interval(self):
+        now = [0.0]
+        table = [frozenset({"IL"})]
+        validate = CachedValidator(version=lambda: table[0], check_interval=5,
+                                   clock=lambda: now[0])
+        validate(make_record())
+        table[0] = frozenset({"IL", "WI"})
+        validate(make_record())
+        self.assertEqual(validate.hits, 1)       # within the interval: not looked at yet
+        now[0] = 5.0
+        validate(make_record())
+        self.assertEqual((validate.hits, validate.misses), (1, 2))
+
+    def test_lru_byte_limit_and_ttl(self):
+        now = [0.0]
+        validate = CachedValidator(max_bytes=3000, ttl=10, clock=lambda: now[0])
+        records = [make_record(name=f"user {i}") for i in range(20)]
+        for rec in records:
+            validate(rec)
+        self.assertLessEqual(validate.nbytes, 3000)
+        self.assertGreater(validate.evictions, 0)
+        validate(records[-1])
+        self.assertEqual(validate.hits, 1)
+        validate(records[0])             # evicted long ago
+        self.assertEqual(validate.hits, 1)
+        now[0] = 11.0
+        validate(records[-1])
+        self.assertEqual(validate.expirations, 1)
+
+    def test_returned_dict_is_a_copy(self):
+        validate = CachedValidator()
+        validate(make_record())["name"] = "changed"
+        self.assertEqual(validate(make_record())["name"], "Amtoj Singh")
+
+
+class TestAsyncIngest(unittest.TestCase):
+    def test_socket_clients_through_bounded_queues(self):
+        lines = [json.dumps({"id": f"r{i}", **make_record(age=20 + i % 200, start_date="2025-09-01",
+                                                         end_date="2025-12-15")})
+                 for i in range(300)] + ["{not json"]
+        good_out, bad_out = io.StringIO(), io.StringIO()
+
+        async def client(path, chunk):
+            reader, writer = await asyncio.open_unix_connection(path)
+            for line in chunk:
+                writer.write(line.encode() + b"\n")
+                await writer.drain()
+            writer.write_eof()
+            reply = await reader.readline()
+            writer.close()
+            return reply
+
+        async def run(path):
+            with ThreadPoolExecutor(1) as pool:
+                async with IngestPipeline(good_out, bad_out, workers=2, queue_size=8,
+                                          batch_size=4, executor=pool) as pipe:
+                    server = await asyncio.start_unix_server(pipe.handle_connection, path)
+                    async with server:
+                        replies = await asyncio.gather(client(path, lines[::2]),
+                                                       client(path, lines[1::2]))
+            return pipe, replies
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pipe, replies = asyncio.run(run(os.path.join(tmp, "in.sock")))
+        self.assertEqual(replies, [b"accepted 151\n", b"accepted 150\n"])
+        # ages cycle 20..219: 182 of the 300 are in range, plus one unreadable line
+        self.assertEqual((pipe.stats.good, pipe.stats.bad), (182, 119))
+        self.assertLessEqual(pipe.metrics.queues["in"].max_depth, 8)
+        self.assertEqual(pipe.metrics.latency.count, 301)
+        self.assertEqual(len(good_out.getvalue().splitlines()), pipe.stats.good)
+        self.assertIn("1:151,unreadable record", bad_out.getvalue())
+        self.assertIn('ingest_queue_max_depth{queue="in"}', pipe.metrics.to_prometheus())
+
+    def test_failed_batch_becomes_rejects(self):
+        class FailingPool(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                if "boom" in args[-1]:      # the batch's record ids
+                    raise RuntimeError("worker died")
+                return super().submit(fn, *args)
+
+        records = [(f"r{i}", make_record()) for i in range(20)] + [("boom", make_record())]
+        good_out, bad_out = io.StringIO(), io.StringIO()
+
+        async def run():
+            with FailingPool(1) as pool:
+                async with IngestPipeline(good_out, bad_out, batch_size=4,
+                                          executor=pool) as pipe:
+                    await pipe.feed(records)
+            return pipe
+
+        pipe = asyncio.run(run())
+        self.assertEqual(pipe.stats.good + pipe.stats.bad, 21)
+        self.assertGreaterEqual(pipe.stats.good, 17)
+        self.assertIn("boom,unexpected error: RuntimeError('worker died')", bad_out.getvalue())
+
+    def test_own_process_pool_is_replaced_after_a_crash(self):
+        records = ([(f"r{i}", make_record()) for i in range(3)]
+                   + [("crash", CrashingRecord(make_record()))]
+                   + [(f"s{i}", make_record()) for i in range(3)])
+        good_out, bad_out = io.StringIO(), io.StringIO()
+
+        async def run():
+            async with IngestPipeline(good_out, bad_out, workers=1, batch_size=1) as pipe:
+                await pipe.feed(records)
+            return pipe
+
+        pipe = asyncio.run(run())
+        self.assertEqual((pipe.stats.good, pipe.stats.bad), (6, 1))
+        self.assertIn("crash,unexpected error: BrokenProcessPool", bad_out.getvalue())
+
+    def test_callers_broken_pool_stops_the_pipeline(self):
+        async def run():
+            with ProcessPoolExecutor(1) as pool:
+                pipe = await IngestPipeline(io.StringIO(), io.StringIO(), workers=1,
+                                            batch_size=1, executor=pool).start()
+                await pipe.submit("crash", CrashingRecord(make_record()))
+                await asyncio.wait_for(pipe.failed.wait(), 30)
+                with self.assertRaises(RuntimeError):
+                    await pipe.submit(None, make_record())
+                with self.assertRaises(BrokenProcessPool):
+                    await asyncio.wait_for(pipe.close(), 30)
+
+        asyncio.run(run())
+
+    def test_write_error_stops_the_pipeline(self):
+        class FullDisk(io.StringIO):
+            def write(self, text):
+                raise OSError(28, "No space left on device")
+
+        async def run():
+            with ThreadPoolExecutor(1) as pool:
+                pipe = await IngestPipeline(FullDisk(), io.StringIO(), queue_size=4,
+                                            batch_size=2, executor=pool).start()
+                await pipe.feed((i, make_record()) for i in range(3))
+                await asyncio.wait_for(pipe.failed.wait(), 5)
+                with self.assertRaises(RuntimeError):
+                    await pipe.submit(None, make_record())
+                with self.assertRaises(OSError):
+                    await asyncio.wait_for(pipe.close(), 5)
+                return pipe
+
+        self.assertIsInstance(asyncio.run(run()).error, OSError)
+
+
+class TestDateIngest(unittest.TestCase):
+    def test_parse_and_errors(self):
+        self.assertEqual(parse_date(" 2025-09-01 "), date(2025, 9, 1))
+        self.assertEqual(parse_date(date(2025, 9, 1)), date(2025, 9, 1))
+        for bad in ("2025-02-30", "soon", "", None, 20250901):
+            with self.assertRaises(ValueError) as ctx:
+                parse_date(bad)
+            self.assertEqual(str(ctx.exception), DATE_ERROR)
+        rec = coerce_dates(make_record(start_date="2025-09-01", end_date="2025-13-01"))
+        self.assertEqual(rec["start_date"], date(2025, 9, 1))
+        self.assertEqual(outcome(validate_record, rec), ("bad", DATE_ERROR))
+
+    def test_column_matches_single_values(self):
+        col = ["2025-09-01", "2025-09-01", "bad", None, date(2024, 1, 1), "2024-02-29"]
+        self.assertEqual(parse_date_column(col),
+                         [date(2025, 9, 1), date(2025, 9, 1), "bad", None,
+                          date(2024, 1, 1), date(2024, 2, 29)])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -11,13 +11,12 @@ Non-Wikiversity refs (syntax only):
 """
 
 from datetime import date
-import re
 
-# small allowed set for a cross-reference check
-ALLOWED_US_STATES = {"IL", "WI", "IN", "MI", "IA", "MN", "MO", "OH"}
+# shared email rules (EMAIL_RE is re-exported here for older imports)
+from email_validation import EMAIL_RE, is_valid_email  # noqa: F401
 
-# basic pattern (kept simple on purpose)
-EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+# code tables for cross-reference checks (refdata/*.txt, hot-reloaded)
+from reference_data import us_states
 
 
 def validate_record(rec):
@@ -28,7 +27,7 @@ def validate_record(rec):
       - Data type:       age=int, balance=float
       - Range/constraint: age in 0..110, balance >= 0, password length >= 8
       - Structured:      email matches a simple pattern
-      - Code/x-ref:      if country == 'US', state must be in our allowed set
+      - Code/x-ref:      if country == 'US', state must be in the us_states table
       - Consistency:     start_date <= end_date
     """
     # pull + trim
@@ -46,7 +45,7 @@ def validate_record(rec):
         raise ValueError("name is required")
 
     # structured / pattern
-    if not EMAIL_RE.match(email):
+    if not is_valid_email(email):
         raise ValueError("email looks invalid")
 
     # data type + range/constraint (age)
@@ -69,7 +68,7 @@ def validate_record(rec):
 
     # code/x-ref + nested if example
     if country == "US":
-        if state not in ALLOWED_US_STATES:
+        if state not in us_states():
             raise ValueError("state must be a valid 2-letter code for US in our list")
 
     # consistency: dates present and ordered
@@ -145,7 +144,7 @@ def run_demo():
             "balance": 5.5,
             "password": "abcdefgh",
             "country": "US",
-            "state": "CA",  # not in our small set
+            "state": "ZZ",  # not a US state code
             "start_date": date(2025, 9, 1),
             "end_date": date(2025, 12, 15),
         },
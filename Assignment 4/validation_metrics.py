@@ -0,0 +1,137 @@
+"""
+CIS 216 – Assignment 4 (Validation), metrics
+Author: Amtoj Singh
+
+run_demo() only prints good/bad totals. ValidationMetrics also keeps,
+for every rule: how many times it ran, how many times it failed and how
+much time it took in total, plus a histogram of per-record latency.
+
+How it is wired in:
+  - compile_schema(..., metrics=m) compiles counters and timers into the
+    generated validator around every rule. Without metrics= the
+    generated code is exactly the uninstrumented code, so "disabled"
+    costs nothing at all.
+  - m.wrap(fn) times whole calls into the latency histogram and counts
+    good/bad records.
+
+Export with to_json() or to_prometheus() (Prometheus text format).
+"""
+
+from bisect import bisect_left
+import json
+import time
+
+# seconds; roughly 1us .. 10ms on a log scale
+DEFAULT_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """[(upper bound or "+Inf", observations <= bound), ...]"""
+        out = []
+        running = 0
+        for bound, n in zip(self.bounds + ("+Inf",), self.counts):
+            running += n
+            out.append((bound, running))
+        return out
+
+    def to_dict(self):
+        return {"buckets": self.cumulative(), "sum": self.sum, "count": self.count}
+
+
+class ValidationMetrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.rules = []        # rule names, in slot order
+        self.evaluations = []  # the compiled validator bumps these lists
+        self.failures = []     # directly by slot index
+        self.seconds = []
+        self.latency = Histogram(buckets)
+        self.good = 0
+        self.bad = 0
+
+    def slot(self, rule_name):
+        """Index for a rule's counters (registered on first use)."""
+        if rule_name in self.rules:
+            return self.rules.index(rule_name)
+        self.rules.append(rule_name)
+        self.evaluations.append(0)
+        self.failures.append(0)
+        self.seconds.append(0.0)
+        return len(self.rules) - 1
+
+    def wrap(self, fn):
+        """Wrap a validator so each call is timed and counted good/bad."""
+        clock = time.perf_counter
+        observe = self.latency.observe
+
+        def timed(rec):
+            start = clock()
+            try:
+                result = fn(rec)
+            except ValueError:
+                self.bad += 1
+                raise
+            finally:
+                observe(clock() - start)
+            self.good += 1
+            return result
+
+        timed.__name__ = getattr(fn, "__name__", "timed")
+        return timed
+
+    def rule_stats(self):
+        return {
+            name: {
+                "evaluations": self.evaluations[i],
+                "failures": self.failures[i],
+                "seconds": self.seconds[i],
+            }
+            for i, name in enumerate(self.rules)
+        }
+
+    def to_dict(self):
+        return {
+            "records": {"good": self.good, "bad": self.bad},
+            "rules": self.rule_stats(),
+            "record_latency_seconds": self.latency.to_dict(),
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix="validation"):
+        lines = [
+            f"# HELP {prefix}_records_total Records validated, by result.",
+            f"# TYPE {prefix}_records_total counter",
+            f'{prefix}_records_total{{result="good"}} {self.good}',
+            f'{prefix}_records_total{{result="bad"}} {self.bad}',
+        ]
+        for metric, values, kind, help_text in (
+            ("rule_evaluations_total", self.evaluations, "counter", "Times each rule ran."),
+            ("rule_failures_total", self.failures, "counter", "Times each rule failed."),
+            ("rule_seconds_total", self.seconds, "counter", "Time spent in each rule."),
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for name, value in zip(self.rules, values):
+                lines.append(f'{prefix}_{metric}{{rule="{name}"}} {value}')
+
+        name = f"{prefix}_record_seconds"
+        lines.append(f"# HELP {name} Time to validate one record.")
+        lines.append(f"# TYPE {name} histogram")
+        for bound, n in self.latency.cumulative():
+            lines.append(f'{name}_bucket{{le="{bound}"}} {n}')
+        lines.append(f"{name}_sum {self.latency.sum}")
+        lines.append(f"{name}_count {self.latency.count}")
+        return "\n".join(lines) + "\n"
@@ -10,6 +10,26 @@ Reference:
 - Python docs on classes & inheritance: https://docs.python.org/3/tutorial/classes.html
 """
 
+# --- field rules (shared by the setters and roster_import) ---
+def clean_name(value) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("Name cannot be empty.")
+    return value.strip().title()
+
+
+def clean_email(value) -> str:
+    v = (value or "").strip()
+    if "@" not in v or "." not in v.split("@")[-1]:
+        raise ValueError("Email must look like user@example.com")
+    return v
+
+
+def clean_employee_id(value) -> int:
+    if not isinstance(value, int) or value < 0:
+        raise ValueError("Employee ID must be a positive integer")
+    return value
+
+
 class Employee:
     def __init__(self, name: str, email: str, employee_id: int) -> None:
         self.name = name
@@ -23,9 +43,7 @@ class Employee:
 
     @name.setter
     def name(self, value: str) -> None:
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError("Name cannot be empty.")
-        self._name = value.strip().title()
+        self._name = clean_name(value)
 
     @property
     def email(self) -> str:
@@ -33,10 +51,7 @@ class Employee:
 
     @email.setter
     def email(self, value: str) -> None:
-        v = (value or "").strip()
-        if "@" not in v or "." not in v.split("@")[-1]:
-            raise ValueError("Email must look like user@example.com")
-        self._email = v
+        self._email = clean_email(value)
 
     @property
     def employee_id(self) -> int:
@@ -44,9 +59,16 @@ class Employee:
 
     @employee_id.setter
     def employee_id(self, value: int) -> None:
-        if not isinstance(value, int) or value < 0:
-            raise ValueError("Employee ID must be a positive integer")
-        self._employee_id = value
+        self._employee_id = clean_employee_id(value)
+
+    @classmethod
+    def _from_clean(cls, name: str, email: str, employee_id: int) -> "Employee":
+        """Build from values that already passed the clean_* rules (no re-checks)."""
+        obj = cls.__new__(cls)
+        obj._name = name
+        obj._email = email
+        obj._employee_id = employee_id
+        return obj
 
     # --- shared methods ---
     def contact_info(self) -> str:
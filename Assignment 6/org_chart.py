@@ -0,0 +1,135 @@
+"""
+OrgChart: manager -> reports hierarchy for Employee objects.
+
+Every node keeps a precomputed rollup of its whole subtree (total pay and
+headcount), so "total biweekly cost under manager X" is a dict lookup.
+When someone's pay changes (or a node is added/moved/removed) only the
+chain of managers above that node is touched, which is O(depth).
+
+Money is kept in integer cents internally so repeated +/- updates never
+drift the way float sums do.
+"""
+
+from employee import Employee
+
+
+def _to_cents(amount: float) -> int:
+    v = float(amount)
+    if v < 0:
+        raise ValueError("Pay cannot be negative")
+    return round(v * 100)
+
+
+class OrgChart:
+    def __init__(self) -> None:
+        self._employees = {}     # employee_id -> Employee
+        self._manager = {}       # employee_id -> manager employee_id (or None)
+        self._reports = {}       # employee_id -> set of direct report ids
+        self._pay = {}           # employee_id -> own pay (cents)
+        self._subtree_pay = {}   # employee_id -> pay of self + everyone below (cents)
+        self._subtree_count = {} # employee_id -> headcount of self + everyone below
+
+    # --- building the chart ---
+    def add(self, employee: Employee, pay: float, manager_id: int = None) -> None:
+        """Add an employee (with their per-period pay) under manager_id, or as a root."""
+        eid = employee.employee_id
+        if eid in self._employees:
+            raise ValueError(f"Employee #{eid} is already in the chart")
+        if manager_id is not None and manager_id not in self._employees:
+            raise KeyError(f"Unknown manager #{manager_id}")
+
+        cents = _to_cents(pay)
+        self._employees[eid] = employee
+        self._manager[eid] = manager_id
+        self._reports[eid] = set()
+        self._pay[eid] = cents
+        self._subtree_pay[eid] = cents
+        self._subtree_count[eid] = 1
+
+        if manager_id is not None:
+            self._reports[manager_id].add(eid)
+            self._bubble(manager_id, cents, 1)
+
+    def set_pay(self, employee_id: int, pay: float) -> None:
+        """Change one person's pay; only their chain of managers is updated."""
+        cents = _to_cents(pay)
+        delta = cents - self._pay[employee_id]
+        if delta == 0:
+            return
+        self._pay[employee_id] = cents
+        self._bubble(employee_id, delta, 0)
+
+    def move(self, employee_id: int, new_manager_id: int = None) -> None:
+        """Re-point employee_id (and their whole subtree) at a new manager."""
+        if employee_id not in self._employees:
+            raise KeyError(f"Unknown employee #{employee_id}")
+        if new_manager_id is not None:
+            if new_manager_id not in self._employees:
+                raise KeyError(f"Unknown manager #{new_manager_id}")
+            if employee_id == new_manager_id or employee_id in self.chain(new_manager_id):
+                raise ValueError("Move would create a reporting cycle")
+
+        pay = self._subtree_pay[employee_id]
+        count = self._subtree_count[employee_id]
+        old = self._manager[employee_id]
+        if old is not None:
+            self._reports[old].discard(employee_id)
+            self._bubble(old, -pay, -count)
+
+        self._manager[employee_id] = new_manager_id
+        if new_manager_id is not None:
+            self._reports[new_manager_id].add(employee_id)
+            self._bubble(new_manager_id, pay, count)
+
+    def remove(self, employee_id: int) -> None:
+        """Remove someone with no direct reports (move their reports first)."""
+        if self._reports[employee_id]:
+            raise ValueError(f"Employee #{employee_id} still has direct reports")
+        self.move(employee_id, None)
+        for table in (self._employees, self._manager, self._reports,
+                      self._pay, self._subtree_pay, self._subtree_count):
+            del table[employee_id]
+
+    def _bubble(self, start_id: int, pay_delta: int, count_delta: int) -> None:
+        """Apply a delta to start_id and every manager above it."""
+        node = start_id
+        while node is not None:
+            self._subtree_pay[node] += pay_delta
+            self._subtree_count[node] += count_delta
+            node = self._manager[node]
+
+    # --- queries ---
+    def __len__(self) -> int:
+        return len(self._employees)
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self._employees
+
+    def employee(self, employee_id: int) -> Employee:
+        return self._employees[employee_id]
+
+    def manager_of(self, employee_id: int):
+        return self._manager[employee_id]
+
+    def direct_reports(self, employee_id: int) -> list:
+        return sorted(self._reports[employee_id])
+
+    def chain(self, employee_id: int) -> list:
+        """Managers above employee_id, nearest first."""
+        out = []
+        node = self._manager[employee_id]
+        while node is not None:
+            out.append(node)
+            node = self._manager[node]
+        return out
+
+    def pay(self, employee_id: int) -> float:
+        return self._pay[employee_id] / 100
+
+    def subtree_cost(self, employee_id: int) -> float:
+        """Total pay of employee_id plus everyone under them, O(1)."""
+        return self._subtree_pay[employee_id] / 100
+
+    def headcount(self, employee_id: int) -> int:
+        """Number of people in the subtree, including employee_id, O(1)."""
+        return self._subtree_count[employee_id]
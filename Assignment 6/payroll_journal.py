@@ -0,0 +1,175 @@
+"""
+PayrollJournal: append-only audit log of pay results.
+
+Each record on disk is:
+    [4-byte length][4-byte crc32][payload]
+where the payload is employee_id (int64), gross and net (float64, NaN
+when there is no net amount) followed by the UTF-8 run id. Records are buffered in
+memory and written as one block per batch, followed by a single fsync
+(group commit), instead of syncing after every record.
+
+Replay is a straight sequential scan. A torn tail stops the scan
+cleanly and everything before it is still returned. Only the last record
+can be torn, so a bad record counts as a torn tail only when it could be
+that last record:
+  - fewer than a header plus the fixed fields are left,
+  - everything left is zero (the blocks a power loss can leave behind), or
+  - its length is a possible record length (run ids are at most
+    MAX_RUN_ID bytes) and the record runs past the end of the file.
+Opening a journal truncates such a tail first, so new records are never
+appended after garbage. Any other bad record (a flipped length field, a
+failed checksum with data after it) raises CorruptJournal, and nothing
+is truncated.
+"""
+
+import math
+import mmap
+import os
+import struct
+import zlib
+
+_HEADER = struct.Struct("<II")
+_BODY = struct.Struct("<qdd")
+MAX_RUN_ID = 255                        # bytes of UTF-8
+_MAX_PAYLOAD = _BODY.size + MAX_RUN_ID
+
+
+class CorruptJournal(ValueError):
+    """Raised for a bad record that cannot be a torn tail (bad length or checksum mid-file)."""
+
+
+class PayrollJournal:
+    def __init__(self, path: str, batch_size: int = 4096, sync: bool = True) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        self.path = path
+        self.batch_size = batch_size
+        self.sync = sync
+        self._pending = []
+        _truncate_torn_tail(path)
+        self._file = open(path, "ab")
+
+    def append(self, run_id: str, employee_id: int, gross: float, net: float = None) -> None:
+        """Queue one pay result; it is durable after the next commit()."""
+        run = run_id.encode("utf-8")
+        if len(run) > MAX_RUN_ID:
+            raise ValueError(f"run_id is longer than {MAX_RUN_ID} bytes")
+        payload = _BODY.pack(employee_id, gross, math.nan if net is None else net) + run
+        self._pending.append(_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        if len(self._pending) >= self.batch_size:
+            self.commit()
+
+    def append_run(self, run_id: str, results) -> None:
+        """results: iterable of (employee_id, gross) or (employee_id, gross, net)."""
+        for row in results:
+            self.append(run_id, *row)
+        self.commit()
+
+    def commit(self) -> None:
+        """Write everything queued as one block and fsync once."""
+        if not self._pending:
+            return
+        self._file.write(b"".join(self._pending))
+        self._pending.clear()
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.commit()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _decode(payload: bytes) -> dict:
+    employee_id, gross, net = _BODY.unpack_from(payload)
+    rec = {"run": payload[_BODY.size:].decode("utf-8"), "id": employee_id, "gross": gross}
+    if net == net:  # NaN marks "no net amount"
+        rec["net"] = net
+    return rec
+
+
+def _scan(data):
+    """
+    Yield (end of record, payload) for every good record. Stops quietly
+    at a torn tail; raises CorruptJournal for a bad record mid-file.
+    """
+    pos = 0
+    end = len(data)
+    unpack = _HEADER.unpack_from
+    while pos < end:
+        left = end - pos
+        if left < _HEADER.size + _BODY.size:
+            return  # torn tail: too short to be a record
+        length, crc = unpack(data, pos)
+        stop = pos + _HEADER.size + length
+        possible = _BODY.size <= length <= _MAX_PAYLOAD
+        if possible and stop <= end:
+            payload = data[pos + _HEADER.size:stop]
+            if zlib.crc32(payload) == crc:
+                yield stop, payload
+                pos = stop
+                continue
+        if (possible and stop > end) or data[pos:].count(0) == left:
+            return  # torn tail from an interrupted write (or zero-filled blocks)
+        raise CorruptJournal(f"Bad record at byte {pos}")
+
+
+def _open_mapped(f):
+    if os.fstat(f.fileno()).st_size == 0:
+        return None
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _truncate_torn_tail(path: str) -> None:
+    """Cut the file back to the end of its last good record."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        data = _open_mapped(f)
+        if data is None:
+            return
+        with data:
+            good = 0
+            for good, _ in _scan(data):
+                pass
+            size = len(data)
+    if good < size:
+        os.truncate(path, good)
+
+
+def replay(path: str):
+    """Yield every committed record (as a dict) in write order."""
+    with open(path, "rb") as f:
+        data = _open_mapped(f)
+        if data is None:
+            return
+        with data:
+            for _, payload in _scan(data):
+                yield _decode(payload)
+
+
+def rebuild_register(path: str, run_id: str) -> dict:
+    """Rebuild one past pay register: employee_id -> record (last write wins)."""
+    register = {}
+    for rec in replay(path):
+        if rec["run"] == run_id:
+            register[rec["id"]] = rec
+    return register
+
+
+def run_ids(path: str) -> list:
+    """Pay runs found in the journal, in the order they first appear."""
+    seen = {}
+    for rec in replay(path):
+        seen.setdefault(rec["run"], None)
+    return list(seen)
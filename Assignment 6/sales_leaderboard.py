@@ -0,0 +1,117 @@
+"""
+SalesLeaderboard: live top-K of commission earned by SalesEmployee.
+
+Sale events are fed in one at a time. Running commission totals are kept
+for every salesperson, and the current top K sit in a min-heap with a
+position index (employee_id -> heap slot), so a total that grows can be
+fixed in place with one sift: O(log K) per event.
+
+Readers call snapshot(), which returns an immutable, sorted tuple. It is
+rebuilt at most once per change and shared by every reader until the
+next event, so polling it while ingestion continues is cheap.
+"""
+
+import threading
+
+from sales import SalesEmployee
+
+
+class SalesLeaderboard:
+    def __init__(self, k: int = 10) -> None:
+        if k <= 0:
+            raise ValueError("k must be > 0")
+        self.k = k
+        self._totals = {}   # employee_id -> total commission (all salespeople)
+        self._names = {}    # employee_id -> display name
+        self._heap = []     # min-heap of [total, employee_id], size <= k
+        self._pos = {}      # employee_id -> index in _heap
+        self._lock = threading.Lock()
+        self._snapshot = ()
+        self._dirty = False
+
+    # --- ingestion ---
+    def record(self, employee: SalesEmployee, amount: float) -> float:
+        """Record one sale; returns the commission it earned."""
+        commission = employee.record_sales(amount)
+        eid = employee.employee_id
+        with self._lock:
+            self._names[eid] = employee.name
+            total = self._totals.get(eid, 0.0) + commission
+            self._totals[eid] = total
+            self._offer(eid, total)
+        return commission
+
+    def consume(self, events) -> int:
+        """events: iterable of (SalesEmployee, sale_amount). Returns count."""
+        n = 0
+        for employee, amount in events:
+            self.record(employee, amount)
+            n += 1
+        return n
+
+    def _offer(self, eid: int, total: float) -> None:
+        heap = self._heap
+        i = self._pos.get(eid)
+        if i is not None:
+            # totals only grow, so the entry can only move down a min-heap
+            heap[i][0] = total
+            self._sift_down(i)
+            self._dirty = True
+        elif len(heap) < self.k:
+            heap.append([total, eid])
+            self._pos[eid] = len(heap) - 1
+            self._sift_up(len(heap) - 1)
+            self._dirty = True
+        elif total > heap[0][0]:
+            del self._pos[heap[0][1]]
+            heap[0] = [total, eid]
+            self._pos[eid] = 0
+            self._sift_down(0)
+            self._dirty = True
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][1]] = i
+        self._pos[heap[j][1]] = j
+
+    def _sift_up(self, i: int) -> None:
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap[i][0] >= heap[parent][0]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int) -> None:
+        heap = self._heap
+        n = len(heap)
+        while True:
+            left = 2 * i + 1
+            smallest = i
+            if left < n and heap[left][0] < heap[smallest][0]:
+                smallest = left
+            if left + 1 < n and heap[left + 1][0] < heap[smallest][0]:
+                smallest = left + 1
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+    # --- reads ---
+    def total(self, employee_id: int) -> float:
+        return round(self._totals.get(employee_id, 0.0), 2)
+
+    def snapshot(self) -> tuple:
+        """Top K as ((employee_id, name, total), ...), highest first."""
+        if not self._dirty:
+            return self._snapshot
+        with self._lock:
+            if self._dirty:
+                rows = sorted(self._heap, key=lambda e: (-e[0], e[1]))
+                self._snapshot = tuple(
+                    (eid, self._names[eid], round(total, 2)) for total, eid in rows
+                )
+                self._dirty = False
+            return self._snapshot
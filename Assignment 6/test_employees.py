@@ -4,11 +4,19 @@ Run:
     python -m unittest discover -s "Assignment 6" -p "test_*.py" -v
 """
 
+import os
+import tempfile
 import unittest
 from employee import Employee
 from manager import Manager
 from sales import SalesEmployee
 from hourly import HourlyEmployee
+from org_chart import OrgChart
+from withholding import WithholdingEngine
+from payroll_journal import CorruptJournal, PayrollJournal, rebuild_register, replay, run_ids
+from timecards import TimeCardEngine
+from sales_leaderboard import SalesLeaderboard
+from roster_import import import_rows
 
 class TestEmployeeBase(unittest.TestCase):
     def test_contact_info(self):
@@ -50,5 +58,179 @@ class TestPoly(unittest.TestCase):
         self.assertTrue(any("Sales" in line for line in lines))
         self.assertTrue(any("Hourly" in line for line in lines))
 
+class TestOrgChart(unittest.TestCase):
+    def setUp(self):
+        self.org = OrgChart()
+        self.ceo = Manager("Ceo", "ceo@c.com", 1, 260000)
+        self.vp = Manager("Vp", "vp@c.com", 2, 130000)
+        self.rep = HourlyEmployee("Rep", "rep@c.com", 3, 20)
+        self.org.add(self.ceo, self.ceo.compute_pay(26))
+        self.org.add(self.vp, self.vp.compute_pay(26), manager_id=1)
+        self.org.add(self.rep, self.rep.compute_pay(80), manager_id=2)
+
+    def test_rollups(self):
+        self.assertEqual(self.org.subtree_cost(1), 10000 + 5000 + 2000)
+        self.assertEqual(self.org.headcount(1), 3)
+        self.assertEqual(self.org.subtree_cost(2), 5000 + 2000)
+        self.assertEqual(self.org.chain(3), [2, 1])
+
+    def test_pay_change_and_move(self):
+        self.org.set_pay(3, 1000)
+        self.assertEqual(self.org.subtree_cost(1), 16000)
+        self.org.move(3, 1)
+        self.assertEqual(self.org.subtree_cost(2), 5000)
+        self.assertEqual(self.org.headcount(1), 3)
+        with self.assertRaises(ValueError):
+            self.org.move(1, 2)
+        self.org.remove(3)
+        self.assertEqual(self.org.headcount(1), 2)
+
+
+class TestWithholding(unittest.TestCase):
+    def test_progressive_net_pay(self):
+        eng = WithholdingEngine([(0, 0.10), (26000, 0.20)], [(0, 0.05)], periods=26)
+        # 2000/period -> 52000/yr: fed 2600 + 5200, state 2600 -> 400/period
+        self.assertEqual(eng.withholding(2000), 400.0)
+        h = HourlyEmployee("Hana", "hana@work.com", 4001, 20)
+        self.assertEqual(eng.net_pay_for(h, 80), 1600.0)
+        m = Manager("Boss", "boss@corp.com", 2001, 52000)
+        self.assertEqual(eng.run_payroll([(m, (26,)), (h, (80,))]), [1600.0, 1600.0])
+        self.assertEqual(eng.net_pay_batch([0, 500]), [0.0, 500 - 75.0])
+
+
+class TestPayrollJournal(unittest.TestCase):
+    def test_replay_and_torn_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pay.journal")
+            with PayrollJournal(path, batch_size=2) as j:
+                j.append_run("2025-01", [(1, 100.0), (2, 250.5, 200.0), (3, 80.0)])
+                j.append_run("2025-02", [(1, 110.0)])
+            with open(path, "ab") as f:
+                f.write(b"\x10\x00\x00\x00garbage")  # simulated crash mid-write
+            self.assertEqual(len(list(replay(path))), 4)
+            reg = rebuild_register(path, "2025-01")
+            self.assertEqual(sorted(reg), [1, 2, 3])
+            self.assertEqual(reg[2]["net"], 200.0)
+
+    def test_reopen_after_crash(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pay.journal")
+            with PayrollJournal(path) as j:
+                j.append_run("2025-01", [(1, 100.0), (2, 250.5)])
+            # crash mid-write, then zero-filled blocks after a power loss
+            for n, tail in enumerate((b"\x10\x00\x00\x00garbage", b"\x00" * 4096), start=1):
+                with open(path, "ab") as f:
+                    f.write(tail)
+                self.assertEqual(len(list(replay(path))), 2 * n)
+                with PayrollJournal(path) as j:
+                    j.append_run(f"2025-0{n + 1}", [(3, 80.0), (4, 90.0)])
+                self.assertEqual(len(list(replay(path))), 2 * n + 2)
+            self.assertEqual(run_ids(path), ["2025-01", "2025-02", "2025-03"])
+
+    def test_corruption_mid_file_raises(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pay.journal")
+            with PayrollJournal(path) as j:
+                j.append_run("2025-01", [(1, 100.0), (2, 250.5)])
+            with open(path, "r+b") as f:
+                f.seek(10)
+                f.write(b"\xff")
+            with self.assertRaises(CorruptJournal):
+                list(replay(path))
+            with self.assertRaises(CorruptJournal):
+                PayrollJournal(path)
+
+    def test_bad_length_mid_file_is_not_a_torn_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pay.journal")
+            with PayrollJournal(path) as j:
+                j.append_run("2025-01", [(i, 100.0) for i in range(1000)])
+            size = os.path.getsize(path)
+            with open(path, "r+b") as f:
+                f.seek(3)                   # high byte of the first length field
+                f.write(b"\x01")
+            with self.assertRaises(CorruptJournal):
+                list(replay(path))
+            with self.assertRaises(CorruptJournal):
+                PayrollJournal(path)
+            self.assertEqual(os.path.getsize(path), size)   # nothing truncated
+
+    def test_record_cut_inside_run_id(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pay.journal")
+            with PayrollJournal(path) as j:
+                j.append_run("2025-01 regular", [(1, 100.0), (2, 250.5)])
+            os.truncate(path, os.path.getsize(path) - 3)
+            self.assertEqual(len(list(replay(path))), 1)
+            with PayrollJournal(path) as j:
+                with self.assertRaises(ValueError):
+                    j.append("x" * 256, 3, 80.0)
+
+
+class TestTimeCards(unittest.TestCase):
+    def test_weekly_only_matches_compute_pay(self):
+        staff = [HourlyEmployee("A", "a@c.com", 1, 20), HourlyEmployee("B", "b@c.com", 2, 17.35)]
+        weeks = [[8, 8, 8, 8, 8, 5, 0], [10.25, 9, 12, 0, 7.5, 3.3, 1]]
+        pays = TimeCardEngine.weekly_only().compute_pay(staff, weeks)
+        self.assertEqual(pays, [e.compute_pay(sum(w)) for e, w in zip(staff, weeks)])
+
+    def test_daily_double_and_seventh_day(self):
+        eng = TimeCardEngine()
+        reg, ot, dt = eng.hours_breakdown([[13, 0, 0, 0, 0, 0, 0], [6, 6, 6, 6, 6, 6, 10]])
+        self.assertEqual((reg[0], ot[0], dt[0]), (8, 4, 1))
+        self.assertEqual((reg[1], ot[1], dt[1]), (36, 8, 2))
+        h = HourlyEmployee("A", "a@c.com", 1, 10)
+        self.assertEqual(eng.compute_pay([h], [[13, 0, 0, 0, 0, 0, 0]]), [80 + 60 + 20])
+
+    def test_rules_apply_without_daily_overtime(self):
+        eng = TimeCardEngine(daily_overtime=False)
+        reg, ot, dt = eng.hours_breakdown([[13, 0, 0, 0, 0, 0, 0], [6, 6, 6, 6, 6, 6, 10],
+                                           [10, 10, 10, 10, 10, 0, 0]])
+        self.assertEqual((reg[0], ot[0], dt[0]), (12, 0, 1))    # double time still applies
+        self.assertEqual((reg[1], ot[1], dt[1]), (36, 8, 2))    # and so does the seventh day
+        self.assertEqual((reg[2], ot[2], dt[2]), (40, 10, 0))   # weekly rule only
+
+
+class TestSalesLeaderboard(unittest.TestCase):
+    def test_top_k_updates_in_place(self):
+        reps = [SalesEmployee(f"Rep {i}", f"r{i}@c.com", i, 400, 0.1) for i in range(1, 6)]
+        board = SalesLeaderboard(k=3)
+        board.consume([(reps[0], 1000), (reps[1], 2000), (reps[2], 3000), (reps[3], 500)])
+        self.assertEqual([row[0] for row in board.snapshot()], [3, 2, 1])
+        board.record(reps[3], 5000)   # rep 4 jumps to the top, rep 1 drops out
+        board.record(reps[1], 2000)   # rep 2 passes rep 3 with 400 total
+        self.assertEqual(board.snapshot(), ((4, "Rep 4", 550.0), (2, "Rep 2", 400.0), (3, "Rep 3", 300.0)))
+        self.assertEqual(board.total(1), 100.0)
+
+
+class TestRosterImport(unittest.TestCase):
+    ROWS = [
+        {"name": " ada lovelace ", "email": "ada@corp.com", "employee_id": "7"},
+        {"name": "", "email": "nope", "employee_id": 8},
+        {"name": "Bo", "email": "bo@corp.com", "employee_id": 9},
+    ]
+
+    def test_collects_all_errors_in_order(self):
+        for workers in (1, 2):
+            rep = import_rows(self.ROWS * 2, workers=workers, chunk_size=2, parallel_threshold=0)
+            self.assertEqual([e.employee_id for e in rep.valid], [7, 9, 7, 9])
+            self.assertEqual(rep.valid[0].name, Employee("ada lovelace", "ada@corp.com", 7).name)
+            self.assertEqual([(e.row, e.field) for e in rep.errors],
+                             [(2, "name"), (2, "email"), (5, "name"), (5, "email")])
+
+    def test_odd_values_become_row_errors(self):
+        rows = [{"name": "A", "email": "a@corp.com", "employee_id": "²"},
+                {"name": "B", "email": 42, "employee_id": 2},
+                {"name": "C", "email": "c@corp.com", "employee_id": 3}]
+        rep = import_rows(rows)
+        self.assertEqual([(e.row, e.field) for e in rep.errors], [(1, "employee_id"), (2, "email")])
+        self.assertEqual([e.employee_id for e in rep.valid], [3])
+
+    def test_columnar(self):
+        rep = import_rows(self.ROWS, columnar=True)
+        self.assertEqual(rep.valid["email"], ["ada@corp.com", "bo@corp.com"])
+        self.assertEqual(rep.bad_rows, 1)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
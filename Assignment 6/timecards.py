@@ -0,0 +1,104 @@
+"""
+TimeCardEngine: overtime rules over an (employee x day) hours matrix.
+
+HourlyEmployee.compute_pay(hours) only knows the weekly >40h rule. This
+engine works on a whole week of daily hours for every hourly employee at
+once and supports:
+  - daily overtime:   hours past 8 in a day at 1.5x
+  - double time:      hours past 12 in a day at 2.0x
+  - seventh day:      7th consecutive worked day -> first 8h at 1.5x,
+                      the rest at 2.0x
+  - weekly overtime:  regular hours past 40 in the week at 1.5x
+
+Each rule can be turned on or off on its own and is applied column by
+column (one list operation per day) across all rows. With only the weekly rule turned on the result matches
+HourlyEmployee.compute_pay(sum(week)) exactly.
+"""
+
+from hourly import HourlyEmployee
+
+DAYS = 7
+
+
+class TimeCardEngine:
+    def __init__(self, daily_overtime: bool = True, double_time: bool = True,
+                 seventh_day: bool = True, weekly_limit: float = 40,
+                 daily_limit: float = 8, double_time_after: float = 12) -> None:
+        self.daily_overtime = daily_overtime
+        self.double_time = double_time
+        self.seventh_day = seventh_day
+        self.weekly_limit = weekly_limit
+        self.daily_limit = daily_limit
+        self.double_time_after = double_time_after
+
+    @classmethod
+    def weekly_only(cls) -> "TimeCardEngine":
+        """Same rule as HourlyEmployee.compute_pay()."""
+        return cls(daily_overtime=False, double_time=False, seventh_day=False)
+
+    def hours_breakdown(self, matrix):
+        """
+        matrix: list of rows, each row = 7 daily hour totals (Mon..Sun).
+        Returns (regular, overtime, double_time) lists, one entry per row.
+        """
+        rows = [[float(h) for h in row] for row in matrix]
+        for row in rows:
+            if len(row) != DAYS:
+                raise ValueError("Each time card row must have 7 daily totals")
+            if any(h < 0 for h in row):
+                raise ValueError("Hours worked cannot be negative")
+
+        n = len(rows)
+        regular = [0.0] * n
+        overtime = [0.0] * n
+        double = [0.0] * n
+        if n == 0:
+            return regular, overtime, double
+
+        cols = list(zip(*rows))
+        # rows that worked all 7 days get the seventh-day rule on day 7
+        all_week = [all(h > 0 for h in r) for r in rows] if self.seventh_day else [False] * n
+
+        split = self._split_day
+        for d, col in enumerate(cols):
+            flags = all_week if d == DAYS - 1 else [False] * n
+            parts = [split(h, s) for h, s in zip(col, flags)]
+            regular = [a + p[0] for a, p in zip(regular, parts)]
+            overtime = [a + p[1] for a, p in zip(overtime, parts)]
+            double = [a + p[2] for a, p in zip(double, parts)]
+
+        # weekly rule: regular hours past the limit become overtime
+        wl = self.weekly_limit
+        spill = [max(r - wl, 0.0) for r in regular]
+        regular = [min(r, wl) for r in regular]
+        overtime = [o + s for o, s in zip(overtime, spill)]
+        return regular, overtime, double
+
+    def _split_day(self, hours: float, seventh: bool):
+        """One day's hours -> (regular, overtime, double time)."""
+        dl = self.daily_limit
+        if seventh:
+            return 0.0, min(hours, dl), max(hours - dl, 0.0)
+        # each rule works on its own: double time takes the hours past its
+        # threshold, daily overtime the hours past the daily limit of the rest
+        double = max(hours - self.double_time_after, 0.0) if self.double_time else 0.0
+        rest = hours - double
+        if self.daily_overtime:
+            return min(rest, dl), max(rest - dl, 0.0), double
+        # no daily overtime: the rest is regular; the weekly rule sorts it out
+        return rest, 0.0, double
+
+    def compute_pay(self, employees, matrix) -> list:
+        """Gross pay for each HourlyEmployee given their row of the matrix."""
+        rates = []
+        for emp in employees:
+            if not isinstance(emp, HourlyEmployee):
+                raise TypeError("TimeCardEngine only pays HourlyEmployee objects")
+            rates.append(emp.hourly_rate)
+        regular, overtime, double = self.hours_breakdown(matrix)
+        if len(rates) != len(regular):
+            raise ValueError("Need exactly one time card row per employee")
+        return [
+            round(r * rate + o * rate * 1.5 + d * rate * 2.0, 2)
+            for r, o, d, rate in zip(regular, overtime, double, rates)
+        ]
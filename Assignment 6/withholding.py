@@ -0,0 +1,109 @@
+"""
+Withholding engine: turns gross pay from compute_pay() into net pay.
+
+Bracket tables (federal + state) are loaded once into sorted lists. For
+each bracket we also precompute the total tax owed on everything below
+it, so a lookup is one bisect plus one multiply instead of a walk over
+every bracket.
+
+Tables are annual (like the published ones); per-period gross pay is
+annualized with `periods` (26 = biweekly) and the tax is divided back.
+
+Example table file (JSON):
+    {"federal": [[0, 0.10], [11600, 0.12], [47150, 0.22]],
+     "state":   [[0, 0.0495]]}
+Each pair is [annual income where the bracket starts, marginal rate].
+"""
+
+from bisect import bisect_right
+import json
+
+
+class BracketTable:
+    def __init__(self, brackets) -> None:
+        rows = sorted((float(start), float(rate)) for start, rate in brackets)
+        if not rows or rows[0][0] != 0:
+            raise ValueError("Bracket table must start at 0")
+        for start, rate in rows:
+            if not (0 <= rate <= 1):
+                raise ValueError("Bracket rates must be between 0.0 and 1.0")
+
+        self.starts = [start for start, _ in rows]
+        self.rates = [rate for _, rate in rows]
+        # base[i] = tax owed on income up to starts[i]
+        self.base = [0.0]
+        for i in range(1, len(rows)):
+            width = self.starts[i] - self.starts[i - 1]
+            self.base.append(self.base[-1] + width * self.rates[i - 1])
+
+    def tax(self, income: float) -> float:
+        """Annual tax on annual income (bisect lookup)."""
+        if income <= 0:
+            return 0.0
+        i = bisect_right(self.starts, income) - 1
+        return self.base[i] + (income - self.starts[i]) * self.rates[i]
+
+    def tax_many(self, incomes) -> list:
+        """tax() for a whole column of incomes."""
+        starts, base, rates = self.starts, self.base, self.rates
+        out = []
+        append = out.append
+        for income in incomes:
+            if income <= 0:
+                append(0.0)
+                continue
+            i = bisect_right(starts, income) - 1
+            append(base[i] + (income - starts[i]) * rates[i])
+        return out
+
+
+class WithholdingEngine:
+    def __init__(self, federal, state=None, periods: int = 26) -> None:
+        if periods <= 0:
+            raise ValueError("periods must be > 0")
+        self.federal = federal if isinstance(federal, BracketTable) else BracketTable(federal)
+        if state is None:
+            state = [(0, 0.0)]
+        self.state = state if isinstance(state, BracketTable) else BracketTable(state)
+        self.periods = periods
+
+    @classmethod
+    def from_file(cls, path: str, periods: int = 26) -> "WithholdingEngine":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["federal"], data.get("state"), periods)
+
+    def withholding(self, gross: float) -> float:
+        """Federal + state withholding for one period's gross pay."""
+        g = float(gross)
+        if g < 0:
+            raise ValueError("Gross pay cannot be negative")
+        annual = g * self.periods
+        return round((self.federal.tax(annual) + self.state.tax(annual)) / self.periods, 2)
+
+    def net_pay(self, gross: float) -> float:
+        return round(float(gross) - self.withholding(gross), 2)
+
+    def net_pay_for(self, employee, *pay_args, **pay_kwargs) -> float:
+        """Net pay straight from any employee's compute_pay(...) arguments."""
+        return self.net_pay(employee.compute_pay(*pay_args, **pay_kwargs))
+
+    def net_pay_batch(self, grosses) -> list:
+        """net_pay() for a whole roster's gross amounts in one call."""
+        gross = [float(g) for g in grosses]
+        if any(g < 0 for g in gross):
+            raise ValueError("Gross pay cannot be negative")
+        n = self.periods
+        annual = [g * n for g in gross]
+        fed = self.federal.tax_many(annual)
+        st = self.state.tax_many(annual)
+        return [round(g - round((f + s) / n, 2), 2) for g, f, s in zip(gross, fed, st)]
+
+    def run_payroll(self, entries) -> list:
+        """
+        entries: iterable of (employee, pay_args) pairs, e.g.
+            [(manager, (26,)), (sales_rep, (2400,)), (hourly, (43,))]
+        Returns net pay for each entry, in order.
+        """
+        grosses = [emp.compute_pay(*args) for emp, args in entries]
+        return self.net_pay_batch(grosses)